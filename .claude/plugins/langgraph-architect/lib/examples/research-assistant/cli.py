@@ -76,8 +76,10 @@ def query(
 
             metadata_table.add_row("Confidence", f"{result.get('confidence', 0):.2%}")
             metadata_table.add_row("Iterations", str(result.get('iteration_count', 0)))
-            metadata_table.add_row("Web Results", str(len(result.get('web_results', []))))
-            metadata_table.add_row("Paper Results", str(len(result.get('paper_results', []))))
+            # web_results/paper_results are pre-joined text blocks, so
+            # report presence rather than a count
+            metadata_table.add_row("Web Results", "collected" if result.get('web_results') else "none")
+            metadata_table.add_row("Paper Results", "collected" if result.get('paper_results') else "none")
 
             console.print("\n")
             console.print(metadata_table)
@@ -12,18 +12,31 @@ A production-ready research assistant agent with:
 
 import os
 import asyncio
+import time
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+from functools import lru_cache
 from typing import TypedDict, Annotated, Sequence, Literal
-from datetime import datetime
 
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import (
+    BaseMessage,
+    HumanMessage,
+    AIMessage,
+    SystemMessage,
+    ToolMessage,
+)
 from langchain_core.tools import tool
 from langchain_anthropic import ChatAnthropic
 from langchain_community.vectorstores import Chroma
 from langchain_openai import OpenAIEmbeddings
+import aiosqlite
 from langgraph.graph import StateGraph, START, END
-from langgraph.prebuilt import ToolNode
 from langgraph.graph.message import add_messages
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
 
 # ============================================================================
@@ -37,16 +50,16 @@ class ResearchState(TypedDict):
     Attributes:
         messages: Conversation history
         query: Current research query
-        web_results: Web search results
-        paper_results: Academic paper results
+        web_results: Web search results, pre-joined into one block
+        paper_results: Academic paper results, pre-joined into one block
         synthesis: Final synthesis of findings
         confidence: Confidence score (0-1)
         iteration_count: Number of research iterations
     """
     messages: Annotated[Sequence[BaseMessage], add_messages]
     query: str
-    web_results: list[str]
-    paper_results: list[str]
+    web_results: str
+    paper_results: str
     synthesis: str
     confidence: float
     iteration_count: int
@@ -56,6 +69,31 @@ class ResearchState(TypedDict):
 # Tools
 # ============================================================================
 
+# Result templates, compiled once at module scope so the tool bodies do a
+# single join over a generator instead of per-iteration f-string building
+_WEB_RESULT_TEMPLATE = (
+    "%d. Sample Result %d for '%s'\n"
+    "   Source: https://example.com/result%d\n"
+    "   Summary: This is a sample search result with relevant information."
+)
+
+_PAPER_RESULT_TEMPLATE = (
+    "[%d] Sample Paper %d\n"
+    "    Authors: Author A, Author B\n"
+    "    Year: 202%d\n"
+    "    Abstract: This paper discusses %s and presents novel findings...\n"
+    "    Citation: Author et al. (202%d). Sample Paper %d. Journal Name."
+)
+
+_KEY_POINTS_PLACEHOLDER = (
+    "Key Points:\n"
+    "- Point 1: Important finding from the research\n"
+    "- Point 2: Supporting evidence and data\n"
+    "- Point 3: Implications and conclusions\n"
+    "- Point 4: Areas requiring further investigation"
+)
+
+
 @tool
 async def search_web(query: str, num_results: int = 5) -> str:
     """
@@ -70,15 +108,10 @@ async def search_web(query: str, num_results: int = 5) -> str:
     """
     # TODO: Implement actual web search (Tavily, SerpAPI, etc.)
     # This is a placeholder
-    results = []
-    for i in range(num_results):
-        results.append(
-            f"{i+1}. Sample Result {i+1} for '{query}'\n"
-            f"   Source: https://example.com/result{i+1}\n"
-            f"   Summary: This is a sample search result with relevant information."
-        )
-
-    return "\n\n".join(results)
+    return "\n\n".join(
+        _WEB_RESULT_TEMPLATE % (i + 1, i + 1, query, i + 1)
+        for i in range(num_results)
+    )
 
 
 @tool
@@ -95,17 +128,10 @@ async def search_papers(query: str, max_results: int = 3) -> str:
     """
     # TODO: Implement actual paper search (Semantic Scholar, arXiv, etc.)
     # This is a placeholder
-    results = []
-    for i in range(max_results):
-        results.append(
-            f"[{i+1}] Sample Paper {i+1}\n"
-            f"    Authors: Author A, Author B\n"
-            f"    Year: 202{i}\n"
-            f"    Abstract: This paper discusses {query} and presents novel findings...\n"
-            f"    Citation: Author et al. (202{i}). Sample Paper {i+1}. Journal Name."
-        )
-
-    return "\n\n".join(results)
+    return "\n\n".join(
+        _PAPER_RESULT_TEMPLATE % (i + 1, i + 1, i, query, i, i + 1)
+        for i in range(max_results)
+    )
 
 
 @tool
@@ -121,13 +147,7 @@ async def extract_key_points(text: str) -> str:
     """
     # TODO: Implement actual extraction (could use another LLM call)
     # This is a placeholder
-    return (
-        "Key Points:\n"
-        "- Point 1: Important finding from the research\n"
-        "- Point 2: Supporting evidence and data\n"
-        "- Point 3: Implications and conclusions\n"
-        "- Point 4: Areas requiring further investigation"
-    )
+    return _KEY_POINTS_PLACEHOLDER
 
 
 @tool
@@ -156,10 +176,80 @@ async def verify_facts(claim: str) -> dict:
 research_tools = [search_web, search_papers, extract_key_points, verify_facts]
 
 
+# ============================================================================
+# Model Clients
+# ============================================================================
+
+# Shared clients, created once per process so repeat calls reuse the same
+# HTTP connection pool instead of paying a TCP/TLS handshake per node call
+planner_model = ChatAnthropic(
+    model="claude-3-5-sonnet-20241022",
+    temperature=0
+).bind_tools(research_tools)
+
+synthesis_model = ChatAnthropic(
+    model="claude-3-5-sonnet-20241022",
+    temperature=0.3
+)
+
+quality_model = ChatAnthropic(
+    model="claude-3-5-sonnet-20241022",
+    temperature=0
+)
+
+
 # ============================================================================
 # Memory System
 # ============================================================================
 
+class CachedEmbeddings:
+    """
+    Thin wrapper around OpenAIEmbeddings that caches query embeddings.
+
+    Repeated queries (common when a session revisits a topic, or when a
+    stored synthesis is later retrieved verbatim) skip the embedding API
+    round-trip and hit the vector store directly.
+    """
+
+    def __init__(self, embeddings: OpenAIEmbeddings, cache_size: int = 1024):
+        self._embeddings = embeddings
+        self._cache_size = cache_size
+        self._query_cache: OrderedDict[str, list[float]] = OrderedDict()
+
+    def _lookup(self, text: str) -> list[float] | None:
+        vector = self._query_cache.get(text)
+        if vector is not None:
+            self._query_cache.move_to_end(text)
+        return vector
+
+    def _remember(self, text: str, vector: list[float]) -> list[float]:
+        self._query_cache[text] = vector
+        if len(self._query_cache) > self._cache_size:
+            self._query_cache.popitem(last=False)
+        return vector
+
+    def embed_query(self, text: str) -> list[float]:
+        vector = self._lookup(text)
+        if vector is None:
+            vector = self._remember(text, self._embeddings.embed_query(text))
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Async embed sharing the same cache as embed_query."""
+        vector = self._lookup(text)
+        if vector is None:
+            vector = self._remember(text, await self._embeddings.aembed_query(text))
+        return vector
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents (uncached - document texts rarely repeat)."""
+        return self._embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Async embed documents (uncached - document texts rarely repeat)."""
+        return await self._embeddings.aembed_documents(texts)
+
+
 class SemanticMemory:
     """
     Semantic memory using vector store for context retrieval.
@@ -167,46 +257,85 @@ class SemanticMemory:
 
     def __init__(self, collection_name: str = "research_memory"):
         """Initialize semantic memory."""
-        self.embeddings = OpenAIEmbeddings()
+        self.embeddings = CachedEmbeddings(OpenAIEmbeddings())
         self.vectorstore = Chroma(
             collection_name=collection_name,
             embedding_function=self.embeddings,
-            persist_directory=".research_memory"
+            persist_directory=".research_memory",
+            # Tune the HNSW index for approximate cosine search so query
+            # time stays sub-linear as memories accumulate across sessions
+            collection_metadata={
+                "hnsw:space": "cosine",
+                "hnsw:M": 16,
+                "hnsw:construction_ef": 200
+            }
         )
+        self._pending_texts: list[str] = []
+        self._pending_metadatas: list[dict] = []
 
     async def store(self, text: str, metadata: dict = None) -> None:
-        """Store text in semantic memory."""
+        """
+        Queue text for storage.
+
+        Writes are buffered and flushed as a single batched insert, so one
+        embeddings request covers every text stored during a research run
+        instead of one HTTP round-trip per store() call.
+        """
         if metadata is None:
             metadata = {}
 
-        metadata["timestamp"] = datetime.now().isoformat()
+        # A raw nanosecond tick is far cheaper than datetime.now().isoformat();
+        # format to ISO only when the metadata is read back for display
+        metadata["timestamp"] = time.time_ns()
 
-        self.vectorstore.add_texts(
-            texts=[text],
-            metadatas=[metadata]
-        )
+        self._pending_texts.append(text)
+        self._pending_metadatas.append(metadata)
+
+    async def flush(self) -> None:
+        """Write all pending texts to the vector store in one batch."""
+        if not self._pending_texts:
+            return
+
+        texts = self._pending_texts
+        metadatas = self._pending_metadatas
+        self._pending_texts = []
+        self._pending_metadatas = []
+
+        await self.vectorstore.aadd_texts(texts=texts, metadatas=metadatas)
 
     async def retrieve(self, query: str, k: int = 3) -> list[str]:
         """Retrieve relevant memories."""
-        docs = self.vectorstore.similarity_search(query, k=k)
+        docs = await self.vectorstore.asimilarity_search(query, k=k)
         return [doc.page_content for doc in docs]
 
+    async def warm(self) -> None:
+        """
+        Pre-warm the embedding client and vector index.
+
+        Issues a tiny embed + similarity search so the first real
+        retrieve() does not pay for HTTPS session establishment or the
+        Chroma index load.
+        """
+        await self.retrieve("warmup", k=1)
+
+    async def get_embeddings(self, texts: list[str]) -> np.ndarray:
+        """Embed texts and return an (N, dim) float32 matrix."""
+        vectors = await self.embeddings.aembed_documents(texts)
+        return np.asarray(vectors, dtype=np.float32)
+
 
 # Global memory instance
 memory = SemanticMemory()
 
 
 # ============================================================================
-# Agent Nodes
+# Prompts
 # ============================================================================
 
-async def research_planner_node(state: ResearchState) -> ResearchState:
-    """
-    Plan the research strategy.
+# Prompt templates live at module scope so node calls substitute values
+# into an existing string instead of rebuilding the template per call
 
-    Determines what sources to search and what questions to answer.
-    """
-    system_prompt = """You are a research planning specialist. Your job is to:
+_PLANNER_SYSTEM_PROMPT = """You are a research planning specialist. Your job is to:
 1. Analyze the research query
 2. Determine what information is needed
 3. Plan which tools to use (web search, paper search, fact verification)
@@ -214,18 +343,80 @@ async def research_planner_node(state: ResearchState) -> ResearchState:
 
 Use the available tools strategically to gather comprehensive information."""
 
-    model = ChatAnthropic(
-        model="claude-3-5-sonnet-20241022",
-        temperature=0
-    ).bind_tools(research_tools)
+# Messages are immutable by convention, so one instance is shared safely
+_PLANNER_SYSTEM_MESSAGE = SystemMessage(content=_PLANNER_SYSTEM_PROMPT)
+
+_SYNTHESIS_TEMPLATE = """Based on the research findings below, create a comprehensive summary.
+
+QUERY: {query}
+
+WEB RESEARCH:
+{web_results}
+
+ACADEMIC RESEARCH:
+{paper_results}
 
-    messages = [SystemMessage(content=system_prompt)] + list(state["messages"])
+{key_points}
 
-    response = await model.ainvoke(messages)
+RELEVANT CONTEXT FROM MEMORY:
+{memory_text}
+
+Provide a well-structured summary that:
+1. Answers the research query
+2. Synthesizes information from multiple sources
+3. Highlights key findings and insights
+4. Notes any limitations or areas needing further research
+5. Provides a confidence assessment
+
+Format the summary in markdown with clear sections."""
+
+_QUALITY_CHECK_TEMPLATE = """Evaluate the quality of this research summary:
+
+ORIGINAL QUERY: {query}
+
+RESEARCH SUMMARY:
+{synthesis}
+
+Assessment criteria:
+1. Does it directly answer the query?
+2. Is the information comprehensive?
+3. Are sources properly cited?
+4. Is the conclusion well-supported?
+5. Are there significant gaps?
+
+Provide:
+- Overall quality score (0-1)
+- Specific strengths
+- Areas for improvement
+- Recommendation (approve/revise)"""
+
+
+# ============================================================================
+# Agent Nodes
+# ============================================================================
+
+async def research_planner_node(state: ResearchState) -> ResearchState:
+    """
+    Plan the research strategy.
+
+    Determines what sources to search and what questions to answer.
+    """
+    iteration_count = state.get("iteration_count", 0)
+
+    # Iteration cap: past the limit, skip the LLM call entirely and let
+    # the router fall through to synthesis
+    if iteration_count >= 10:
+        return {"iteration_count": iteration_count}
+
+    # Tuple unpacking prepends the system message without the extra
+    # list(...) copy of the full history on every planner iteration
+    messages = (_PLANNER_SYSTEM_MESSAGE, *state["messages"])
+
+    response = await planner_model.ainvoke(messages)
 
     return {
         "messages": [response],
-        "iteration_count": state.get("iteration_count", 0) + 1
+        "iteration_count": iteration_count + 1
     }
 
 
@@ -252,7 +443,7 @@ async def web_research_node(state: ResearchState) -> ResearchState:
     )
 
     return {
-        "web_results": [results],
+        "web_results": results,
         "messages": [message]
     }
 
@@ -280,7 +471,7 @@ async def paper_research_node(state: ResearchState) -> ResearchState:
     )
 
     return {
-        "paper_results": [results],
+        "paper_results": results,
         "messages": [message]
     }
 
@@ -293,53 +484,68 @@ async def synthesis_node(state: ResearchState) -> ResearchState:
     """
     query = state["query"]
 
-    # Retrieve relevant context from memory
-    memory_context = await memory.retrieve(query, k=5)
-
-    # Build synthesis prompt
-    web_results = "\n\n".join(state.get("web_results", []))
-    paper_results = "\n\n".join(state.get("paper_results", []))
-    memory_text = "\n\n".join(memory_context)
-
-    synthesis_prompt = f"""Based on the research findings below, create a comprehensive summary.
-
-QUERY: {query}
+    # Results are stored pre-joined at write time, so this is O(1) access
+    web_results = state.get("web_results", "")
+    paper_results = state.get("paper_results", "")
 
-WEB RESEARCH:
-{web_results}
-
-ACADEMIC RESEARCH:
-{paper_results}
-
-RELEVANT CONTEXT FROM MEMORY:
-{memory_text}
-
-Provide a well-structured summary that:
-1. Answers the research query
-2. Synthesizes information from multiple sources
-3. Highlights key findings and insights
-4. Notes any limitations or areas needing further research
-5. Provides a confidence assessment
+    # Memory retrieval and key-point extraction are independent, so run
+    # them concurrently instead of paying for both sequentially
+    memory_context, key_points = await asyncio.gather(
+        memory.retrieve(query, k=5),
+        extract_key_points.ainvoke({"text": f"{web_results}\n\n{paper_results}"})
+    )
 
-Format the summary in markdown with clear sections."""
+    memory_text = "\n\n".join(memory_context)
 
-    model = ChatAnthropic(
-        model="claude-3-5-sonnet-20241022",
-        temperature=0.3
+    synthesis_prompt = _SYNTHESIS_TEMPLATE.format(
+        query=query,
+        web_results=web_results,
+        paper_results=paper_results,
+        key_points=key_points,
+        memory_text=memory_text
     )
 
-    response = await model.ainvoke([HumanMessage(content=synthesis_prompt)])
+    # Stream the synthesis so downstream consumers (astream callers, the
+    # MCP server) see first tokens immediately instead of waiting for the
+    # full completion
+    parts = []
+    async for chunk in synthesis_model.astream([HumanMessage(content=synthesis_prompt)]):
+        if chunk.content:
+            parts.append(chunk.content)
+
+    synthesis_text = "".join(parts)
+
+    # Confidence is the mean cosine agreement between the synthesis and
+    # its sources - one batched embed plus a single BLAS matrix-vector
+    # product instead of a hardcoded placeholder
+    sources = [text for text in (web_results, paper_results, memory_text) if text]
+    if sources and synthesis_text:
+        source_matrix, synth_vec = await asyncio.gather(
+            memory.get_embeddings(sources),
+            memory.embeddings.aembed_query(synthesis_text)
+        )
+        synth_vec = np.asarray(synth_vec, dtype=np.float32)
+        # Clamp the norms: a zero embedding (empty-ish text, provider
+        # edge case) would otherwise push nan/inf into the confidence
+        norms = np.maximum(
+            np.linalg.norm(source_matrix, axis=1) * np.linalg.norm(synth_vec),
+            1e-12
+        )
+        confidence = float(np.mean((source_matrix @ synth_vec) / norms))
+    else:
+        confidence = 0.0
 
-    # Store synthesis in memory
+    # Store synthesis in memory and flush the batched writes from this run
     await memory.store(
-        f"Research synthesis for '{query}':\n{response.content}",
+        f"Research synthesis for '{query}':\n{synthesis_text}",
         {"source": "synthesis", "query": query}
     )
+    await memory.flush()
 
     return {
-        "synthesis": response.content,
-        "confidence": 0.85,  # TODO: Calculate actual confidence
-        "messages": [response]
+        "synthesis": synthesis_text,
+        "confidence": confidence,
+        "messages": [AIMessage(content=synthesis_text, name="synthesizer")]
     }
 
 
@@ -352,41 +558,51 @@ async def quality_check_node(state: ResearchState) -> ResearchState:
     query = state["query"]
     synthesis = state.get("synthesis", "")
 
-    check_prompt = f"""Evaluate the quality of this research summary:
+    check_prompt = _QUALITY_CHECK_TEMPLATE.format(query=query, synthesis=synthesis)
 
-ORIGINAL QUERY: {query}
+    response = await quality_model.ainvoke([HumanMessage(content=check_prompt)])
 
-RESEARCH SUMMARY:
-{synthesis}
+    return {"messages": [response]}
 
-Assessment criteria:
-1. Does it directly answer the query?
-2. Is the information comprehensive?
-3. Are sources properly cited?
-4. Is the conclusion well-supported?
-5. Are there significant gaps?
 
-Provide:
-- Overall quality score (0-1)
-- Specific strengths
-- Areas for improvement
-- Recommendation (approve/revise)"""
+# ============================================================================
+# Tool Execution Node
+# ============================================================================
 
-    model = ChatAnthropic(
-        model="claude-3-5-sonnet-20241022",
-        temperature=0
-    )
+_tools_by_name = {t.name: t for t in research_tools}
 
-    response = await model.ainvoke([HumanMessage(content=check_prompt)])
 
-    return {"messages": [response]}
+async def parallel_tool_node(state: ResearchState) -> ResearchState:
+    """
+    Execute the planner's tool calls concurrently.
 
+    The calls the planner emits in a single turn have no data
+    dependency on one another, so run them through asyncio.gather and
+    zip the results back as ToolMessages in the original call order.
+    """
+    tool_calls = state["messages"][-1].tool_calls
 
-# ============================================================================
-# Tool Execution Node
-# ============================================================================
+    async def _run(call: dict) -> str:
+        # Tool names come from the model and can be hallucinated; answer
+        # with an error ToolMessage (as ToolNode did) so the planner can
+        # self-correct instead of killing the graph run
+        tool = _tools_by_name.get(call["name"])
+        if tool is None:
+            return f"Error: unknown tool '{call['name']}'"
+        return await tool.ainvoke(call["args"])
+
+    results = await asyncio.gather(*[_run(call) for call in tool_calls])
+
+    messages = [
+        ToolMessage(
+            content=str(result),
+            tool_call_id=call["id"],
+            name=call["name"]
+        )
+        for call, result in zip(tool_calls, results)
+    ]
 
-tool_node = ToolNode(research_tools)
+    return {"messages": messages}
 
 
 # ============================================================================
@@ -397,45 +613,39 @@ def should_continue(state: ResearchState) -> str:
     """
     Route based on agent's tool calls.
     """
-    messages = state["messages"]
-    last_message = messages[-1]
-
-    # Check for tool calls
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-        return "tools"
-
-    # Check iteration limit
-    if state.get("iteration_count", 0) >= 10:
-        return "synthesize"
+    # Single branch on this per-turn hot path; the iteration limit is
+    # enforced inside the planner itself (both router outcomes were
+    # "synthesize" anyway)
+    return "tools" if getattr(state["messages"][-1], "tool_calls", None) else "synthesize"
 
-    return "synthesize"
 
-
-def route_research_type(state: ResearchState) -> list[str]:
+async def dispatch_research_node(state: ResearchState) -> ResearchState:
     """
-    Route to appropriate research nodes (can run in parallel).
+    Fan-out point for the parallel research branches.
+
+    Web and paper research have no data dependency, so they branch from
+    here and run concurrently, joining again at synthesis.
     """
-    # In a real implementation, this would be dynamic based on query
-    # For now, we do both web and paper research
-    return ["web_research", "paper_research"]
+    return {}
 
 
 # ============================================================================
 # Graph Construction
 # ============================================================================
 
-def create_research_graph():
+def _build_workflow() -> StateGraph:
     """
-    Create the research assistant graph.
+    Wire up the research assistant workflow (uncompiled).
 
     Returns:
-        Compiled StateGraph
+        StateGraph ready to be compiled with a checkpointer
     """
     workflow = StateGraph(ResearchState)
 
     # Add nodes
     workflow.add_node("planner", research_planner_node)
-    workflow.add_node("tools", tool_node)
+    workflow.add_node("tools", parallel_tool_node)
+    workflow.add_node("dispatch", dispatch_research_node)
     workflow.add_node("web_research", web_research_node)
     workflow.add_node("paper_research", paper_research_node)
     workflow.add_node("synthesis", synthesis_node)
@@ -450,15 +660,18 @@ def create_research_graph():
         should_continue,
         {
             "tools": "tools",
-            "synthesize": "web_research"  # Skip to research if no tools needed
+            "synthesize": "dispatch"  # Skip to research if no tools needed
         }
     )
 
     # Tools go back to planner
     workflow.add_edge("tools", "planner")
 
-    # Parallel research (in practice, would use Send for true parallelism)
-    workflow.add_edge("web_research", "paper_research")
+    # Parallel research: both branches run in the same superstep and
+    # join at synthesis, so wall-clock is max(web, papers), not the sum
+    workflow.add_edge("dispatch", "web_research")
+    workflow.add_edge("dispatch", "paper_research")
+    workflow.add_edge("web_research", "synthesis")
     workflow.add_edge("paper_research", "synthesis")
 
     # Synthesis goes to quality check
@@ -467,10 +680,57 @@ def create_research_graph():
     # Quality check ends
     workflow.add_edge("quality_check", END)
 
-    # Add checkpointing
+    return workflow
+
+
+@lru_cache(maxsize=1)
+def create_research_graph():
+    """
+    Create the research assistant graph with a sync SQLite checkpointer.
+
+    Used by sync callers (e.g. the CLI history command). The compiled
+    graph is cached, so repeat calls skip graph construction.
+
+    Returns:
+        Compiled StateGraph
+    """
     checkpointer = SqliteSaver.from_conn_string("research_assistant.db")
 
-    return workflow.compile(checkpointer=checkpointer)
+    return _build_workflow().compile(checkpointer=checkpointer)
+
+
+# Compiled graphs keyed by checkpointer kind, shared across invocations so
+# the aiosqlite connection is pooled instead of reopened per research() call
+_graphs: dict = {}
+_graphs_lock = asyncio.Lock()
+
+
+async def get_research_graph(session_id: str):
+    """
+    Return the compiled research graph for a session.
+
+    MCP sessions (``mcp-*``) are ephemeral by construction and use an
+    in-memory checkpointer; everything else persists through a shared
+    aiosqlite connection in WAL mode, so node state-writes are async and
+    avoid a full fsync per commit.
+    """
+    kind = "memory" if session_id.startswith("mcp-") else "sqlite"
+
+    async with _graphs_lock:
+        graph = _graphs.get(kind)
+        if graph is None:
+            if kind == "memory":
+                checkpointer = MemorySaver()
+            else:
+                conn = await aiosqlite.connect("research_assistant.db")
+                await conn.execute("PRAGMA journal_mode=WAL")
+                await conn.execute("PRAGMA synchronous=NORMAL")
+                checkpointer = AsyncSqliteSaver(conn)
+
+            graph = _build_workflow().compile(checkpointer=checkpointer)
+            _graphs[kind] = graph
+
+    return graph
 
 
 # ============================================================================
@@ -488,11 +748,12 @@ async def research(query: str, session_id: str = None) -> dict:
     Returns:
         Research results
     """
-    graph = create_research_graph()
-
-    # Generate session ID if not provided
+    # Generate session ID if not provided; uuid4 is cheaper than a
+    # formatted timestamp and cannot collide under concurrent calls
     if session_id is None:
-        session_id = f"research-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        session_id = f"research-{uuid.uuid4().hex[:12]}"
+
+    graph = await get_research_graph(session_id)
 
     config = {
         "configurable": {
@@ -507,8 +768,8 @@ async def research(query: str, session_id: str = None) -> dict:
             HumanMessage(content=f"Research this topic comprehensively: {query}")
         ],
         "query": query,
-        "web_results": [],
-        "paper_results": [],
+        "web_results": "",
+        "paper_results": "",
         "synthesis": "",
         "confidence": 0.0,
         "iteration_count": 0
@@ -517,6 +778,9 @@ async def research(query: str, session_id: str = None) -> dict:
     # Run the graph
     result = await graph.ainvoke(initial_state, config)
 
+    # Make sure nothing is left buffered if the run ended early
+    await memory.flush()
+
     return result
 
 
@@ -532,6 +796,9 @@ async def main():
     print("RESEARCH ASSISTANT - Example")
     print("=" * 80)
 
+    # Warm the embedding client and vector index off the hot path
+    await memory.warm()
+
     # Conduct research
     query = "What are the latest developments in LangGraph and agent orchestration?"
 
@@ -550,8 +817,8 @@ async def main():
     print("=" * 80)
     print(f"Confidence: {result.get('confidence', 0):.2f}")
     print(f"Iterations: {result.get('iteration_count', 0)}")
-    print(f"Web results: {len(result.get('web_results', []))}")
-    print(f"Paper results: {len(result.get('paper_results', []))}")
+    print(f"Web results: {'collected' if result.get('web_results') else 'none'}")
+    print(f"Paper results: {'collected' if result.get('paper_results') else 'none'}")
 
 
 if __name__ == "__main__":
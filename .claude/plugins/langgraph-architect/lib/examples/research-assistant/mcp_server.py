@@ -5,13 +5,15 @@ Exposes the research assistant as an MCP (Model Context Protocol) server.
 """
 
 import asyncio
+import uuid
 from typing import Any
 
+from langchain_core.messages import HumanMessage
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from main import research
+from main import research, synthesis_model
 
 
 # Create MCP server
@@ -155,9 +157,9 @@ async def handle_research_topic(arguments: dict) -> list[TextContent]:
     if focus:
         query = f"{topic} (focusing on: {focus})"
 
-    # Generate unique session ID
-    from datetime import datetime
-    session_id = f"mcp-research-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    # Generate unique session ID (uuid4 avoids the strftime cost and the
+    # second-granularity collisions under concurrent calls)
+    session_id = f"mcp-research-{uuid.uuid4().hex[:12]}"
 
     # Conduct research
     result = await research(query, session_id=session_id)
@@ -165,8 +167,8 @@ async def handle_research_topic(arguments: dict) -> list[TextContent]:
     # Format response
     synthesis = result.get("synthesis", "No synthesis generated")
     confidence = result.get("confidence", 0)
-    web_count = len(result.get("web_results", []))
-    paper_count = len(result.get("paper_results", []))
+    web_sources = "collected" if result.get("web_results") else "none"
+    paper_sources = "collected" if result.get("paper_results") else "none"
 
     response_text = f"""# Research Results: {topic}
 
@@ -176,8 +178,8 @@ async def handle_research_topic(arguments: dict) -> list[TextContent]:
 
 **Metadata:**
 - Confidence: {confidence:.1%}
-- Web Sources: {web_count}
-- Academic Sources: {paper_count}
+- Web Sources: {web_sources}
+- Academic Sources: {paper_sources}
 - Research Depth: {depth}
 """
 
@@ -209,8 +211,7 @@ async def handle_verify_claim(arguments: dict) -> list[TextContent]:
         query += f"\n\nContext: {context}"
 
     # Generate session ID
-    from datetime import datetime
-    session_id = f"mcp-verify-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    session_id = f"mcp-verify-{uuid.uuid4().hex[:12]}"
 
     # Conduct research for verification
     result = await research(query, session_id=session_id)
@@ -260,24 +261,43 @@ async def handle_compare_topics(arguments: dict) -> list[TextContent]:
             text="Error: At least 2 topics are required for comparison"
         )]
 
-    # Build comparison query
+    # Generate session ID
+    session_id = f"mcp-compare-{uuid.uuid4().hex[:12]}"
+
+    # Research each topic concurrently - the per-topic runs share no
+    # state, so wall-clock is max(topic) instead of the sum
+    results = await asyncio.gather(*[
+        research(topic, session_id=f"{session_id}-{i}")
+        for i, topic in enumerate(topics)
+    ])
+
+    # Merge the per-topic findings in a final synthesis step
     topics_str = ", ".join(topics)
-    query = f"Compare and contrast these topics: {topics_str}"
+    sections = "\n\n".join(
+        f"## {topic}\n\n{result.get('synthesis', 'No synthesis available')}"
+        for topic, result in zip(topics, results)
+    )
+
+    comparison_prompt = f"""Compare and contrast these topics: {topics_str}
+
+Per-topic research findings:
+
+{sections}
+
+Provide a comparative analysis highlighting similarities and differences."""
 
     if criteria:
         criteria_str = ", ".join(criteria)
-        query += f"\n\nCompare based on these criteria: {criteria_str}"
+        comparison_prompt += f"\n\nCompare based on these criteria: {criteria_str}"
 
-    # Generate session ID
-    from datetime import datetime
-    session_id = f"mcp-compare-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-
-    # Conduct comparative research
-    result = await research(query, session_id=session_id)
+    response = await synthesis_model.ainvoke([HumanMessage(content=comparison_prompt)])
 
     # Format response
-    synthesis = result.get("synthesis", "No comparison available")
-    confidence = result.get("confidence", 0)
+    synthesis = response.content or "No comparison available"
+    confidence = min(
+        (result.get("confidence", 0) for result in results),
+        default=0
+    )
 
     response_text = f"""# Topic Comparison
 
@@ -20,8 +20,9 @@ import logging
 import sys
 from pathlib import Path
 
-from .langgraph_mcp_server import LangGraphMCPServer, main as run_server
-from .agent_registry import AgentRegistry
+# The server and registry pull in the heavy LangGraph/LangChain import
+# chain, so they are imported lazily inside the command handlers - CLI
+# operations like --help or --health never pay for them.
 
 
 def setup_logging(log_level: str = "INFO"):
@@ -34,6 +35,8 @@ def setup_logging(log_level: str = "INFO"):
 
 def discover_agents(registry_path: str = None):
     """Discover and register agents"""
+    from .agent_registry import AgentRegistry
+
     registry = AgentRegistry(registry_path)
     count = registry.discover_agents()
     print(f"Discovered and registered {count} agents")
@@ -43,6 +46,8 @@ def discover_agents(registry_path: str = None):
 
 def validate_agents(registry_path: str = None):
     """Validate all registered agents"""
+    from .agent_registry import AgentRegistry
+
     registry = AgentRegistry(registry_path)
     agents = registry.list_agents()
 
@@ -69,6 +74,8 @@ def validate_agents(registry_path: str = None):
 
 def show_health(registry_path: str = None):
     """Show health status of all agents"""
+    from .agent_registry import AgentRegistry
+
     registry = AgentRegistry(registry_path)
     stats = registry.get_agent_stats()
 
@@ -105,6 +112,8 @@ def show_health(registry_path: str = None):
 
 def export_registry(registry_path: str = None, output_file: str = "registry_export.json"):
     """Export registry to JSON file"""
+    from .agent_registry import AgentRegistry
+
     registry = AgentRegistry(registry_path)
     if registry.export_registry(output_file):
         print(f"Registry exported to: {output_file}")
@@ -120,14 +129,27 @@ def import_registry(registry_path: str = None, input_file: str = None, merge: bo
         print(f"File not found: {input_file}")
         return 1
 
+    from .agent_registry import AgentRegistry
+
     registry = AgentRegistry(registry_path)
     count = registry.import_registry(input_file, merge=merge)
     print(f"Imported {count} agents from: {input_file}")
     return 0
 
 
+# Hardcoded so the version fast path below never has to import the
+# package (and through it the registry / server modules)
+_VERSION = "1.0.0"
+
+
 def main():
     """Main entry point with argument parsing"""
+    # Fast path: answer -V/--version before constructing the argument
+    # parser, which alone pulls in gettext and friends
+    if "-V" in sys.argv[1:] or "--version" in sys.argv[1:]:
+        print(f"langgraph-mcp-server {_VERSION}")
+        return 0
+
     parser = argparse.ArgumentParser(
         description="LangGraph MCP Server - Expose LangGraph agents as MCP tools"
     )
@@ -217,6 +239,8 @@ def main():
     else:
         # Default: Run MCP server
         try:
+            from .langgraph_mcp_server import main as run_server
+
             asyncio.run(run_server())
             return 0
         except KeyboardInterrupt:
@@ -23,19 +23,72 @@ Registry Structure:
     └── ...
 """
 
+import atexit
 import json
 import logging
+import os
 import sys
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
-from datetime import datetime
-import importlib.util
+
+# datetime and importlib.util are imported lazily in the methods that
+# need them, keeping registry import time down for CLI paths that only
+# read metadata
 
 logger = logging.getLogger("agent-registry")
 
+# Use orjson for registry (de)serialization when available - it encodes
+# 3-10x faster than stdlib json and decodes to the same dict shape
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
+# Optional streaming JSON parser; lets large registries be decoded one
+# agent entry at a time instead of materializing the whole dict tree
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Registry files above this size are stream-decoded when ijson is
+# available, keeping peak memory at O(largest entry) not O(file)
+_STREAM_THRESHOLD = 1024 * 1024
+
+
+def _iter_registry_items(path: Path):
+    """Yield (agent_id, agent_data) pairs from a registry JSON file."""
+    if ijson is not None and path.stat().st_size > _STREAM_THRESHOLD:
+        with open(path, 'rb') as f:
+            yield from ijson.kvitems(f, '')
+    else:
+        yield from _loads(path.read_bytes()).items()
+
+
+# Low-cardinality string fields interned on load/update so all agents
+# sharing a value share one object (and compare by pointer)
+_INTERNED_FIELDS = ("agent_type", "health_status", "python_version", "version")
 
-@dataclass
+# Runtime-only fields whose updates do not warrant an immediate registry
+# rewrite; they are flushed lazily (at process exit) instead
+_EPHEMERAL_FIELDS = frozenset({"health_status", "last_invoked", "invocation_count"})
+
+
+# slots=True (the file already requires >=3.10) drops the per-instance
+# __dict__, cutting memory on large registries and making the attribute
+# access in the list_agents filter loop a direct slot lookup
+@dataclass(slots=True)
 class AgentMetadata:
     """Metadata for a LangGraph agent"""
 
@@ -54,6 +107,7 @@ class AgentMetadata:
     # File paths
     module_path: Optional[str] = None
     config_path: Optional[str] = None
+    source_mtime: float = 0.0  # mtime of the agent dir at discovery time
 
     # Metadata
     author: Optional[str] = None
@@ -74,13 +128,30 @@ class AgentMetadata:
     # Configuration
     default_config: Dict[str, Any] = field(default_factory=dict)
 
+    # Memoized frozenset of tags; built lazily, excluded from serialization
+    _tag_set: Optional[frozenset] = field(default=None, repr=False, compare=False)
+
+    @property
+    def tag_set(self) -> frozenset:
+        """Frozenset of tags, memoized for cheap subset checks."""
+        if self._tag_set is None:
+            self._tag_set = frozenset(self.tags)
+        return self._tag_set
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return asdict(self)
+        data = asdict(self)
+        data.pop("_tag_set", None)
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AgentMetadata':
         """Create from dictionary"""
+        for key in _INTERNED_FIELDS:
+            value = data.get(key)
+            if isinstance(value, str):
+                data[key] = sys.intern(value)
+
         return cls(**data)
 
 
@@ -110,42 +181,127 @@ class AgentRegistry:
         self._agents: Dict[str, AgentMetadata] = {}
         self._loaded_modules: Dict[str, Any] = {}
 
+        # Compiled graphs per agent, so repeated invocations reuse the
+        # CompiledGraph instead of re-running create_graph()
+        self._compiled_graphs: Dict[str, Any] = {}
+
+        # Serialized form per agent, refreshed on mutation, so saves do
+        # not re-walk every dataclass with asdict()
+        self._dict_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Secondary indexes, maintained on every mutation so stats and
+        # filtered listings are O(result) instead of full scans
+        self._by_type: Dict[str, Set[str]] = defaultdict(set)
+        self._by_tag: Dict[str, Set[str]] = defaultdict(set)
+        self._enabled: Set[str] = set()
+        self._healthy: Set[str] = set()
+
+        # When True, per-mutation saves are deferred (see _batched_save)
+        self._save_suspended = False
+
+        # Set when only ephemeral fields (health, invocation counters)
+        # have changed since the last save; flushed at process exit
+        self._dirty_ephemeral = False
+        atexit.register(self._flush_ephemeral)
+
         # Load registry
         self._load_registry()
 
-        logger.info(f"Initialized agent registry at: {self.registry_path}")
+        logger.info("Initialized agent registry at: %s", self.registry_path)
 
     def _load_registry(self):
         """Load agent registry from disk"""
         if self.registry_file.exists():
             try:
-                with open(self.registry_file, 'r') as f:
-                    data = json.load(f)
+                for agent_id, agent_data in _iter_registry_items(self.registry_file):
+                    metadata = AgentMetadata.from_dict(agent_data)
+                    self._agents[agent_id] = metadata
+                    self._dict_cache[agent_id] = agent_data
+                    self._index_agent(agent_id, metadata)
 
-                for agent_id, agent_data in data.items():
-                    self._agents[agent_id] = AgentMetadata.from_dict(agent_data)
-
-                logger.info(f"Loaded {len(self._agents)} agents from registry")
+                logger.info("Loaded %d agents from registry", len(self._agents))
             except Exception as e:
-                logger.error(f"Error loading registry: {str(e)}")
-                self._agents = {}
+                logger.error("Error loading registry: %s", e)
+                self._reset_state()
         else:
             logger.info("No existing registry found, starting fresh")
             self._agents = {}
             self._save_registry()
 
+    def _reset_state(self):
+        """Drop all agents along with every derived structure.
+
+        The secondary indexes, dict cache, and loaded-module caches must
+        never outlive the `_agents` entries they describe; resetting only
+        `_agents` leaves stale index entries behind.
+        """
+        self._agents = {}
+        self._dict_cache.clear()
+        self._by_type.clear()
+        self._by_tag.clear()
+        self._enabled.clear()
+        self._healthy.clear()
+        self._loaded_modules.clear()
+        self._compiled_graphs.clear()
+
+    def _index_agent(self, agent_id: str, metadata: AgentMetadata):
+        """Add an agent to the secondary indexes"""
+        self._by_type[metadata.agent_type].add(agent_id)
+        for tag in metadata.tags:
+            self._by_tag[tag].add(agent_id)
+        if metadata.enabled:
+            self._enabled.add(agent_id)
+        if metadata.health_status == "healthy":
+            self._healthy.add(agent_id)
+
+    def _deindex_agent(self, agent_id: str, metadata: AgentMetadata):
+        """Remove an agent from the secondary indexes"""
+        self._by_type[metadata.agent_type].discard(agent_id)
+        for tag in metadata.tags:
+            self._by_tag[tag].discard(agent_id)
+        self._enabled.discard(agent_id)
+        self._healthy.discard(agent_id)
+
+    @contextmanager
+    def _batched_save(self):
+        """
+        Defer per-mutation saves and write once on exit.
+
+        Bulk operations (discovery, import) register many agents in a
+        loop; saving inside each iteration re-serializes the whole
+        registry N times. This context collapses that to a single write.
+        """
+        self._save_suspended = True
+        try:
+            yield
+        finally:
+            self._save_suspended = False
+            self._save_registry()
+
     def _save_registry(self):
         """Save agent registry to disk"""
+        if self._save_suspended:
+            return
+
         try:
-            data = {agent_id: agent.to_dict()
+            data = {agent_id: self._dict_cache.get(agent_id) or agent.to_dict()
                    for agent_id, agent in self._agents.items()}
 
-            with open(self.registry_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Encode once and write the bytes in a single call - json.dump
+            # issues a separate write() per token, which is much slower on
+            # real files, and binary mode skips the TextIOWrapper layer
+            with open(self.registry_file, 'wb') as f:
+                f.write(_dumps(data))
 
+            self._dirty_ephemeral = False
             logger.debug("Registry saved to disk")
         except Exception as e:
-            logger.error(f"Error saving registry: {str(e)}")
+            logger.error("Error saving registry: %s", e)
+
+    def _flush_ephemeral(self):
+        """Persist deferred ephemeral-field updates, if any"""
+        if self._dirty_ephemeral:
+            self._save_registry()
 
     def register_agent(
         self,
@@ -171,6 +327,8 @@ class AgentRegistry:
         Raises:
             ValueError: If agent_id already exists
         """
+        from datetime import datetime
+
         if agent_id in self._agents:
             raise ValueError(f"Agent already registered: {agent_id}")
 
@@ -192,9 +350,11 @@ class AgentRegistry:
 
         # Add to registry
         self._agents[agent_id] = metadata
+        self._dict_cache[agent_id] = metadata.to_dict()
+        self._index_agent(agent_id, metadata)
         self._save_registry()
 
-        logger.info(f"Registered agent: {agent_id} ({name})")
+        logger.info("Registered agent: %s (%s)", agent_id, name)
         return metadata
 
     def unregister_agent(self, agent_id: str) -> bool:
@@ -208,14 +368,17 @@ class AgentRegistry:
             True if agent was unregistered, False if not found
         """
         if agent_id in self._agents:
+            self._deindex_agent(agent_id, self._agents[agent_id])
             del self._agents[agent_id]
+            self._dict_cache.pop(agent_id, None)
 
-            # Also remove from loaded modules
+            # Also remove from loaded modules and compiled graphs
             if agent_id in self._loaded_modules:
                 del self._loaded_modules[agent_id]
+            self._compiled_graphs.pop(agent_id, None)
 
             self._save_registry()
-            logger.info(f"Unregistered agent: {agent_id}")
+            logger.info("Unregistered agent: %s", agent_id)
             return True
 
         return False
@@ -240,16 +403,40 @@ class AgentRegistry:
 
         metadata = self._agents[agent_id]
 
+        # Ephemeral-only updates (health, invocation counters) happen on
+        # every agent invocation; rewriting the whole registry file for
+        # each one is pure write amplification. Apply them in memory and
+        # defer the save to _flush_ephemeral (registered atexit).
+        ephemeral_only = bool(updates) and set(updates) <= _EPHEMERAL_FIELDS
+
+        # Re-index around the mutation so the secondary indexes stay true
+        self._deindex_agent(agent_id, metadata)
+
         # Update fields
         for key, value in updates.items():
             if hasattr(metadata, key):
+                if key in _INTERNED_FIELDS and isinstance(value, str):
+                    value = sys.intern(value)
                 setattr(metadata, key, value)
 
+        # Drop the memoized tag set if the tags changed
+        if "tags" in updates:
+            metadata._tag_set = None
+
+        self._index_agent(agent_id, metadata)
+
+        if ephemeral_only:
+            self._dict_cache[agent_id] = metadata.to_dict()
+            self._dirty_ephemeral = True
+            return metadata
+
         # Update timestamp
+        from datetime import datetime
         metadata.updated_at = datetime.now().isoformat()
 
+        self._dict_cache[agent_id] = metadata.to_dict()
         self._save_registry()
-        logger.debug(f"Updated metadata for agent: {agent_id}")
+        logger.debug("Updated metadata for agent: %s", agent_id)
 
         return metadata
 
@@ -282,17 +469,23 @@ class AgentRegistry:
         Returns:
             Dictionary of agent_id -> AgentMetadata
         """
-        agents = {}
+        # Fast path: no filters active
+        if not enabled_only and agent_type is None and not tags:
+            return dict(self._agents)
 
-        for agent_id, metadata in self._agents.items():
-            # Apply filters
-            if enabled_only and not metadata.enabled:
-                continue
+        # Narrow candidates through the type index when possible
+        if agent_type is not None:
+            candidates = self._by_type.get(agent_type, ())
+        else:
+            candidates = self._agents.keys()
 
-            if agent_type and metadata.agent_type != agent_type:
+        agents = {}
+        for agent_id in candidates:
+            if enabled_only and agent_id not in self._enabled:
                 continue
 
-            if tags and not tags.issubset(set(metadata.tags)):
+            metadata = self._agents[agent_id]
+            if tags and not tags.issubset(metadata.tag_set):
                 continue
 
             agents[agent_id] = metadata
@@ -314,26 +507,37 @@ class AgentRegistry:
         Returns:
             Loaded module or None if failed
         """
+        import importlib.util
+
         # Check cache first
-        if not force_reload and agent_id in self._loaded_modules:
-            logger.debug(f"Returning cached module for agent: {agent_id}")
-            return self._loaded_modules[agent_id]
+        if agent_id in self._loaded_modules:
+            if not force_reload:
+                logger.debug("Returning cached module for agent: %s", agent_id)
+                return self._loaded_modules[agent_id]
+
+            # Evict the stale module before reloading - leaving it in
+            # sys.modules / our cache keeps the whole old module graph
+            # reachable and grows RSS on every hot reload
+            del self._loaded_modules[agent_id]
+            self._compiled_graphs.pop(agent_id, None)
+            sys.modules.pop(f"agent_{agent_id}", None)
+            importlib.invalidate_caches()
 
         # Get metadata
         metadata = self.get_agent_metadata(agent_id)
         if not metadata:
-            logger.error(f"Agent not found in registry: {agent_id}")
+            logger.error("Agent not found in registry: %s", agent_id)
             return None
 
         if not metadata.module_path:
-            logger.error(f"No module path specified for agent: {agent_id}")
+            logger.error("No module path specified for agent: %s", agent_id)
             return None
 
         # Load module
         try:
             module_path = Path(metadata.module_path)
             if not module_path.exists():
-                logger.error(f"Module file not found: {module_path}")
+                logger.error("Module file not found: %s", module_path)
                 self.update_agent_metadata(agent_id, health_status="unhealthy")
                 return None
 
@@ -344,7 +548,7 @@ class AgentRegistry:
             )
 
             if spec is None or spec.loader is None:
-                logger.error(f"Failed to create module spec for: {module_path}")
+                logger.error("Failed to create module spec for: %s", module_path)
                 return None
 
             # Load module
@@ -358,14 +562,46 @@ class AgentRegistry:
             # Update health status
             self.update_agent_metadata(agent_id, health_status="healthy")
 
-            logger.info(f"Loaded agent module: {agent_id}")
+            logger.info("Loaded agent module: %s", agent_id)
             return module
 
         except Exception as e:
-            logger.error(f"Error loading agent {agent_id}: {str(e)}", exc_info=True)
+            logger.error("Error loading agent %s: %s", agent_id, e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             self.update_agent_metadata(agent_id, health_status="unhealthy")
             return None
 
+    def get_compiled_graph(self, agent_id: str) -> Optional[Any]:
+        """
+        Get the compiled graph for an agent, caching the result.
+
+        Graph construction (StateGraph build + compile) dominates the
+        per-call cost for small agents, so the compiled graph is built
+        once per agent and reused across invocations.
+
+        Args:
+            agent_id: Agent whose graph to fetch
+
+        Returns:
+            Compiled graph or None if the agent cannot be loaded
+        """
+        cached = self._compiled_graphs.get(agent_id)
+        if cached is not None:
+            return cached
+
+        module = self.load_agent(agent_id)
+        if not module:
+            return None
+
+        graph = getattr(module, 'graph', None)
+        if graph is None and hasattr(module, 'create_graph'):
+            graph = module.create_graph()
+
+        if graph is not None:
+            self._compiled_graphs[agent_id] = graph
+
+        return graph
+
     def validate_agent(self, agent_id: str) -> bool:
         """
         Validate that an agent module can be loaded and has required attributes.
@@ -388,7 +624,7 @@ class AgentRegistry:
         has_create_graph = hasattr(module, 'create_graph')
 
         if not (has_graph or has_create_graph):
-            logger.error(f"Agent {agent_id} missing required attribute: graph or create_graph")
+            logger.error("Agent %s missing required attribute: graph or create_graph", agent_id)
             self.update_agent_metadata(agent_id, health_status="unhealthy")
             return False
 
@@ -414,67 +650,125 @@ class AgentRegistry:
         scan_path = Path(scan_path)
         discovered = 0
 
-        logger.info(f"Scanning for agents in: {scan_path}")
+        logger.info("Scanning for agents in: %s", scan_path)
 
-        # Look for agent.py files
-        for agent_file in scan_path.rglob("agent.py"):
-            agent_dir = agent_file.parent
-            agent_id = agent_dir.name
+        # Phase 1: collect candidate agent directories. The documented
+        # layout is exactly one level deep (<registry>/<agent_id>/agent.py),
+        # so a targeted scandir pass costs O(agent dirs) instead of the
+        # O(all files) stat storm of rglob.
+        candidates = []  # (agent_id, agent_file, config_file, dir_mtime, existing)
+        with os.scandir(scan_path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
 
-            # Skip if already registered
-            if self.agent_exists(agent_id):
-                logger.debug(f"Agent already registered: {agent_id}")
-                continue
+                agent_dir = Path(entry.path)
+                agent_file = agent_dir / "agent.py"
+                if not agent_file.exists():
+                    continue
+
+                agent_id = entry.name
+                dir_mtime = entry.stat().st_mtime
+
+                # Skip registered agents whose directory has not advanced
+                # since the last scan - no config re-read, no re-register
+                existing = self._agents.get(agent_id)
+                if existing and existing.source_mtime >= dir_mtime:
+                    logger.debug("Agent unchanged since last scan: %s", agent_id)
+                    continue
+
+                candidates.append(
+                    (agent_id, agent_file, agent_dir / "config.json", dir_mtime, existing)
+                )
+
+        if not candidates:
+            return 0
+
+        # Phase 2: read config files concurrently. The reads are pure
+        # I/O, so a thread pool overlaps the per-open latency - on
+        # network filesystems this is the dominant cost of discovery.
+        def _read_config(config_file: Path) -> Optional[bytes]:
+            try:
+                return config_file.read_bytes()
+            except OSError:
+                return None
+
+        from concurrent.futures import ThreadPoolExecutor
 
-            # Look for config.json
-            config_file = agent_dir / "config.json"
-
-            if config_file.exists():
-                try:
-                    with open(config_file, 'r') as f:
-                        config = json.load(f)
-
-                    # Register from config
-                    self.register_agent(
-                        agent_id=agent_id,
-                        name=config.get("name", agent_id),
-                        description=config.get("description", "No description"),
-                        module_path=str(agent_file),
-                        **{k: v for k, v in config.items()
-                           if k not in ["name", "description"]}
-                    )
-
-                    discovered += 1
-                    logger.info(f"Discovered and registered agent: {agent_id}")
-
-                except Exception as e:
-                    logger.error(f"Error registering agent {agent_id}: {str(e)}")
-            else:
-                # Register with minimal metadata
-                try:
-                    self.register_agent(
-                        agent_id=agent_id,
-                        name=agent_id.replace("_", " ").title(),
-                        description=f"Agent: {agent_id}",
-                        module_path=str(agent_file)
-                    )
-                    discovered += 1
-                    logger.info(f"Discovered and registered agent: {agent_id}")
-                except Exception as e:
-                    logger.error(f"Error registering agent {agent_id}: {str(e)}")
+        with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+            raw_configs = list(
+                executor.map(_read_config, (c[2] for c in candidates))
+            )
+
+        # Phase 3: parse and register on the main thread, keeping all
+        # _agents mutations single-threaded; save the registry once at
+        # the end instead of once per registered agent
+        with self._batched_save():
+            for (agent_id, agent_file, _config_file, dir_mtime, existing), raw in zip(
+                candidates, raw_configs
+            ):
+                if raw is not None:
+                    try:
+                        config = _loads(raw)
+
+                        fields = {k: v for k, v in config.items()
+                                  if k not in ["name", "description"]}
+
+                        if existing:
+                            # Directory changed: refresh from config
+                            self.update_agent_metadata(
+                                agent_id,
+                                name=config.get("name", agent_id),
+                                description=config.get("description", "No description"),
+                                module_path=str(agent_file),
+                                source_mtime=dir_mtime,
+                                **fields
+                            )
+                            logger.info("Refreshed agent metadata: %s", agent_id)
+                        else:
+                            # Register from config
+                            self.register_agent(
+                                agent_id=agent_id,
+                                name=config.get("name", agent_id),
+                                description=config.get("description", "No description"),
+                                module_path=str(agent_file),
+                                source_mtime=dir_mtime,
+                                **fields
+                            )
+
+                            discovered += 1
+                            logger.info("Discovered and registered agent: %s", agent_id)
+
+                    except Exception as e:
+                        logger.error("Error registering agent %s: %s", agent_id, e)
+                elif existing:
+                    # Config-less agents have nothing to refresh
+                    self.update_agent_metadata(agent_id, source_mtime=dir_mtime)
+                else:
+                    # Register with minimal metadata
+                    try:
+                        self.register_agent(
+                            agent_id=agent_id,
+                            name=agent_id.replace("_", " ").title(),
+                            description=f"Agent: {agent_id}",
+                            module_path=str(agent_file),
+                            source_mtime=dir_mtime
+                        )
+                        discovered += 1
+                        logger.info("Discovered and registered agent: %s", agent_id)
+                    except Exception as e:
+                        logger.error("Error registering agent %s: %s", agent_id, e)
 
         return discovered
 
     def get_agent_stats(self) -> Dict[str, Any]:
         """Get statistics about registered agents"""
+        # All counts come straight from the secondary indexes - no scans
         total = len(self._agents)
-        enabled = sum(1 for a in self._agents.values() if a.enabled)
-        healthy = sum(1 for a in self._agents.values() if a.health_status == "healthy")
+        enabled = len(self._enabled)
+        healthy = len(self._healthy)
 
-        types = {}
-        for agent in self._agents.values():
-            agent_type = agent.agent_type
-            types[agent_type] = types.get(agent_type, 0) + 1
+        types = {t: len(ids) for t, ids in self._by_type.items() if ids}
 
         return {
             "total_agents": total,
@@ -497,16 +791,26 @@ class AgentRegistry:
             True if successful
         """
         try:
-            with open(output_path, 'w') as f:
-                json.dump(
-                    {agent_id: agent.to_dict() for agent_id, agent in self._agents.items()},
-                    f,
-                    indent=2
-                )
-            logger.info(f"Exported registry to: {output_path}")
+            # Stream one record at a time so peak memory stays at the
+            # largest entry instead of the whole serialized registry;
+            # the output is the same JSON object import_registry reads
+            with open(output_path, 'wb') as f:
+                f.write(b'{')
+                first = True
+                for agent_id, agent in self._agents.items():
+                    if first:
+                        first = False
+                    else:
+                        f.write(b',')
+                    record = self._dict_cache.get(agent_id) or agent.to_dict()
+                    f.write(_dumps(agent_id))
+                    f.write(b': ')
+                    f.write(_dumps(record))
+                f.write(b'}')
+            logger.info("Exported registry to: %s", output_path)
             return True
         except Exception as e:
-            logger.error(f"Error exporting registry: {str(e)}")
+            logger.error("Error exporting registry: %s", e)
             return False
 
     def import_registry(self, input_path: str, merge: bool = True) -> int:
@@ -521,25 +825,24 @@ class AgentRegistry:
             Number of agents imported
         """
         try:
-            with open(input_path, 'r') as f:
-                data = json.load(f)
-
             if not merge:
-                self._agents = {}
+                self._reset_state()
 
             imported = 0
-            for agent_id, agent_data in data.items():
-                if agent_id in self._agents and merge:
-                    logger.debug(f"Skipping existing agent: {agent_id}")
-                    continue
-
-                self._agents[agent_id] = AgentMetadata.from_dict(agent_data)
-                imported += 1
-
-            self._save_registry()
-            logger.info(f"Imported {imported} agents from: {input_path}")
+            with self._batched_save():
+                for agent_id, agent_data in _iter_registry_items(Path(input_path)):
+                    if agent_id in self._agents and merge:
+                        logger.debug("Skipping existing agent: %s", agent_id)
+                        continue
+
+                    metadata = AgentMetadata.from_dict(agent_data)
+                    self._agents[agent_id] = metadata
+                    self._dict_cache[agent_id] = agent_data
+                    self._index_agent(agent_id, metadata)
+                    imported += 1
+            logger.info("Imported %d agents from: %s", imported, input_path)
             return imported
 
         except Exception as e:
-            logger.error(f"Error importing registry: {str(e)}")
+            logger.error("Error importing registry: %s", e)
             return 0
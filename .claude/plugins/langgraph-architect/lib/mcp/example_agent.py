@@ -25,6 +25,7 @@ Usage:
     )
 """
 
+from functools import lru_cache
 from typing import TypedDict, Annotated, Sequence
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langgraph.graph import StateGraph, END
@@ -32,6 +33,24 @@ from langgraph.graph.message import add_messages
 from langgraph.checkpoint.memory import MemorySaver
 
 
+# Keyword sets for greeting detection - tokenizing the input once and
+# intersecting against these is a single pass, vs one substring scan per
+# keyword
+_GREET_WORDS = frozenset({"hello", "hi"})
+_BYE_WORDS = frozenset({"bye", "goodbye"})
+_HELP_WORDS = frozenset({"help"})
+_STATE_PHRASE = "how are you"
+_CAPS_PHRASE = "what can you do"
+
+_CAPABILITIES_RESPONSE = (
+    "I'm a simple greeting agent. I can:\n"
+    "- Say hello and greet you\n"
+    "- Keep track of our conversation\n"
+    "- Respond to questions about how I'm doing\n"
+    "- Say goodbye when you're ready to go"
+)
+
+
 # Define the state schema
 class AgentState(TypedDict):
     """State for the hello world agent"""
@@ -58,20 +77,17 @@ def greeting_node(state: AgentState) -> AgentState:
     # Generate response based on input
     user_input = last_message.content.lower() if hasattr(last_message, 'content') else ""
 
-    if "hello" in user_input or "hi" in user_input:
+    # Tokenize once; set intersection replaces repeated substring scans
+    tokens = frozenset(user_input.replace("!", " ").replace("?", " ").replace(".", " ").replace(",", " ").split())
+
+    if tokens & _GREET_WORDS:
         response = f"Hello! This is greeting #{greeting_count}. How can I help you today?"
-    elif "bye" in user_input or "goodbye" in user_input:
+    elif tokens & _BYE_WORDS:
         response = f"Goodbye! It was nice talking to you. We had {greeting_count} greetings total."
-    elif "how are you" in user_input:
+    elif _STATE_PHRASE in user_input:
         response = "I'm doing great, thank you for asking! I'm here to help with greetings and conversations."
-    elif "what can you do" in user_input or "help" in user_input:
-        response = (
-            "I'm a simple greeting agent. I can:\n"
-            "- Say hello and greet you\n"
-            "- Keep track of our conversation\n"
-            "- Respond to questions about how I'm doing\n"
-            "- Say goodbye when you're ready to go"
-        )
+    elif _CAPS_PHRASE in user_input or tokens & _HELP_WORDS:
+        response = _CAPABILITIES_RESPONSE
     else:
         response = f"Hello! You said: '{user_input}'. This is greeting #{greeting_count}."
 
@@ -82,32 +98,21 @@ def greeting_node(state: AgentState) -> AgentState:
     }
 
 
-def should_continue(state: AgentState) -> str:
-    """
-    Determine if the conversation should continue.
-
-    This is a conditional edge function.
-    """
-    messages = state.get("messages", [])
-    if not messages:
-        return END
-
-    last_message = messages[-1]
-    content = last_message.content.lower() if hasattr(last_message, 'content') else ""
-
-    # End if user says goodbye
-    if "bye" in content or "goodbye" in content:
-        return END
-
-    return END  # For this simple agent, always end after one response
-
-
 # Create the graph
-def create_graph():
+@lru_cache(maxsize=2)
+def create_graph(checkpoint: bool = False):
     """
     Create and compile the LangGraph graph.
 
     This function is called by the MCP server when loading the agent.
+    Memoized so repeated invocations reuse the compiled graph instead of
+    rebuilding the StateGraph on every call.
+
+    Args:
+        checkpoint: Attach a MemorySaver checkpointer. Off by default -
+            checkpointing serializes state after every node, which is
+            pure overhead for single-turn invocations. Multi-turn
+            callers should pass checkpoint=True.
     """
     # Create state graph
     workflow = StateGraph(AgentState)
@@ -118,17 +123,12 @@ def create_graph():
     # Set entry point
     workflow.set_entry_point("greeting")
 
-    # Add conditional edges
-    workflow.add_conditional_edges(
-        "greeting",
-        should_continue,
-        {
-            END: END
-        }
-    )
+    # Single response per turn, so a static edge avoids the conditional
+    # callback (and its content lowercasing) on every transition
+    workflow.add_edge("greeting", END)
 
-    # Compile with checkpointer for state management
-    checkpointer = MemorySaver()
+    # Compile with a checkpointer only when conversation state is wanted
+    checkpointer = MemorySaver() if checkpoint else None
     graph = workflow.compile(checkpointer=checkpointer)
 
     return graph
@@ -144,6 +144,8 @@ if __name__ == "__main__":
 
     async def test_agent():
         """Test the agent directly"""
+        # Multi-turn test conversation, so opt in to checkpointing
+        graph = create_graph(checkpoint=True)
         config = {"configurable": {"thread_id": "test-thread-1"}}
 
         print("Testing Hello World Agent")
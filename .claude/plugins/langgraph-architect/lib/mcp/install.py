@@ -52,6 +52,16 @@ def check_python_version():
     return True
 
 
+def parse_requirements(requirements_file):
+    """Parse package specs from a requirements file, skipping comments"""
+    specs = []
+    for line in requirements_file.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            specs.append(line)
+    return specs
+
+
 def install_dependencies():
     """Install Python dependencies"""
     requirements_file = Path(__file__).parent / "requirements.txt"
@@ -60,10 +70,24 @@ def install_dependencies():
         print_error("requirements.txt not found")
         return False
 
+    specs = parse_requirements(requirements_file)
+    if not specs:
+        print_success("No dependencies to install")
+        return True
+
     print("    Installing dependencies...")
     try:
+        # One pip invocation with all specs as positional args: a single
+        # interpreter startup and a single resolver pass instead of one
+        # per package. --prefer-binary skips sdist builds where wheels
+        # exist; the version check and input prompts only slow things down.
         subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)],
+            [
+                sys.executable, "-m", "pip", "install", *specs,
+                "--disable-pip-version-check",
+                "--no-input",
+                "--prefer-binary",
+            ],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE
         )
@@ -113,9 +137,10 @@ def setup_example_agent(registry_path):
             }
         }
 
+        # Encode once and write in a single call instead of going through
+        # a buffered text writer
         config_file = agent_dir / "config.json"
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        config_file.write_bytes(json.dumps(config, indent=2).encode("utf-8"))
 
         print_success(f"Example agent installed at: {agent_dir}")
         return True
@@ -125,25 +150,20 @@ def setup_example_agent(registry_path):
 
 
 def discover_agents():
-    """Run agent discovery"""
+    """Run agent discovery in-process"""
+    # Importing the registry directly avoids a fresh interpreter startup
+    # (and its import chain) just to scan a directory
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "langgraph_mcp_server", "--discover"],
-            capture_output=True,
-            text=True
-        )
+        sys.path.insert(0, str(Path(__file__).parent))
+        from agent_registry import AgentRegistry
 
-        if result.returncode == 0:
-            print_success("Agents discovered and registered")
-            # Print discovery output
-            for line in result.stdout.split('\n'):
-                if line.strip():
-                    print(f"      {line}")
-            return True
-        else:
-            print_error("Agent discovery failed")
-            print(f"      {result.stderr}")
-            return False
+        registry = AgentRegistry()
+        count = registry.discover_agents()
+
+        print_success("Agents discovered and registered")
+        print(f"      Discovered and registered {count} agents")
+        print(f"      Total agents in registry: {len(registry.list_agents())}")
+        return True
     except Exception as e:
         print_error(f"Failed to run discovery: {e}")
         return False
@@ -191,6 +211,8 @@ def generate_claude_config(registry_path):
 def update_claude_config(config, config_path):
     """Update Claude Desktop configuration"""
     try:
+        existing_bytes = None
+
         # Check if config file exists
         if config_path.exists():
             print_warning("Claude Desktop config already exists")
@@ -200,9 +222,9 @@ def update_claude_config(config, config_path):
                 print("    Skipping config update")
                 return False
 
-            # Read existing config
-            with open(config_path, 'r') as f:
-                existing_config = json.load(f)
+            # Read existing config (json.loads takes bytes directly)
+            existing_bytes = config_path.read_bytes()
+            existing_config = json.loads(existing_bytes)
 
             # Merge configs
             if "mcpServers" not in existing_config:
@@ -211,12 +233,19 @@ def update_claude_config(config, config_path):
             existing_config["mcpServers"].update(config["mcpServers"])
             config = existing_config
 
+        # Skip the write (and any file-watcher churn) if nothing changed
+        new_bytes = json.dumps(config, indent=2).encode("utf-8")
+        if new_bytes == existing_bytes:
+            print_success("Claude Desktop config already up to date")
+            return True
+
         # Create directory if needed
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write config
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Atomic write: a crash mid-write never leaves a torn config
+        tmp_path = config_path.with_name(config_path.name + ".tmp")
+        tmp_path.write_bytes(new_bytes)
+        os.replace(tmp_path, config_path)
 
         print_success(f"Claude Desktop config updated: {config_path}")
         return True
@@ -235,23 +264,20 @@ def run_tests():
         print_warning("Test file not found, skipping tests")
         return True
 
+    # Run the suite in this interpreter - a subprocess would re-import
+    # the whole langgraph/langchain chain a second time
     try:
-        result = subprocess.run(
-            [sys.executable, str(test_file)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        import runpy
 
-        if result.returncode == 0:
+        sys.path.insert(0, str(test_file.parent))
+        runpy.run_path(str(test_file), run_name="__main__")
+        print_success("All tests passed")
+        return True
+    except SystemExit as e:
+        if not e.code:
             print_success("All tests passed")
             return True
-        else:
-            print_error("Some tests failed")
-            print(f"\n{result.stdout}")
-            return False
-    except subprocess.TimeoutExpired:
-        print_error("Tests timed out")
+        print_error("Some tests failed")
         return False
     except Exception as e:
         print_error(f"Failed to run tests: {e}")
@@ -267,17 +293,20 @@ def main():
     if not check_python_version():
         sys.exit(1)
 
-    # Step 2: Install dependencies
-    print_step(2, "Installing dependencies...")
-    if not install_dependencies():
-        print_warning("Some dependencies may have failed to install")
-        print("    You can install manually with: pip install -r requirements.txt")
+    # Step 2: Install dependencies - pip dominates install wall-clock,
+    # so it runs in the background while the filesystem steps proceed
+    from concurrent.futures import ThreadPoolExecutor
+
+    print_step(2, "Installing dependencies (in background)...")
+    executor = ThreadPoolExecutor(max_workers=1)
+    pip_future = executor.submit(install_dependencies)
 
     # Step 3: Create agent registry
     print_step(3, "Creating agent registry...")
     registry_path = create_agent_registry()
     if not registry_path:
         print_error("Failed to create agent registry")
+        executor.shutdown(wait=True)
         sys.exit(1)
 
     # Step 4: Setup example agent
@@ -285,6 +314,12 @@ def main():
     if not setup_example_agent(registry_path):
         print_warning("Example agent setup failed, continuing anyway")
 
+    # Wait for pip before anything imports the installed packages
+    if not pip_future.result():
+        print_warning("Some dependencies may have failed to install")
+        print("    You can install manually with: pip install -r requirements.txt")
+    executor.shutdown(wait=True)
+
     # Step 5: Discover agents
     print_step(5, "Discovering agents...")
     if not discover_agents():
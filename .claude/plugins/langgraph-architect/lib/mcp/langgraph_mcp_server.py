@@ -31,7 +31,10 @@ Usage:
 import asyncio
 import json
 import logging
+import operator
 import sys
+import uuid
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 from contextlib import asynccontextmanager
@@ -46,18 +49,55 @@ except ImportError:
     print("Error: MCP SDK not installed. Run: pip install mcp", file=sys.stderr)
     sys.exit(1)
 
-# LangGraph imports
-try:
-    from langgraph.graph import StateGraph
-    from langgraph.checkpoint.memory import MemorySaver
-    from langchain_core.messages import HumanMessage, AIMessage
-except ImportError:
-    print("Error: LangGraph not installed. Run: pip install langgraph langchain-core", file=sys.stderr)
-    sys.exit(1)
+# pydantic v2's model_construct skips per-field validation; the tool and
+# resource fields come straight from our own registry cache, so they are
+# known-valid and the handlers can skip the validation pass per object
+_tool_construct = getattr(types.Tool, "model_construct", types.Tool)
+_resource_construct = getattr(types.Resource, "model_construct", types.Resource)
+
+# LangGraph imports are deferred to the first agent invocation (see
+# _load_langgraph) - the import tree costs 1-2s of startup that clients
+# doing pure introspection (list_tools and friends) never need
+HumanMessage = None
+MemorySaver = None
+
+
+def _load_langgraph():
+    """Import the langgraph/langchain names on first use"""
+    global HumanMessage, MemorySaver
+
+    if HumanMessage is None:
+        try:
+            from langgraph.checkpoint.memory import MemorySaver as _MemorySaver
+            from langchain_core.messages import HumanMessage as _HumanMessage
+        except ImportError:
+            print("Error: LangGraph not installed. Run: pip install langgraph langchain-core", file=sys.stderr)
+            raise
+
+        HumanMessage = _HumanMessage
+        MemorySaver = _MemorySaver
 
 # Local imports
 from .agent_registry import AgentRegistry, AgentMetadata
 
+# Optional filesystem watcher; with it the server invalidates handler
+# caches on registry changes instead of stat-ing per request
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+# orjson encodes 2-10x faster than stdlib json; agent responses can be
+# large message lists, so the swap matters on the response path
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -65,6 +105,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger("langgraph-mcp-server")
 
+# Cap on tracked conversation threads; every call without a thread_id
+# mints a fresh uuid, so an unbounded dict is a slow leak
+_MAX_ACTIVE_THREADS = 1024
+
+# Bound once; extracts (type, content) from a message in one C call
+_GET_TYPE_CONTENT = operator.attrgetter("type", "content")
+
+# Bound at module scope so thread-id generation skips the per-call
+# import machinery and attribute lookup
+_uuid4 = uuid.uuid4
+
+# Every agent tool shares the same input schema; one module-level dict
+# shared by reference beats rebuilding ~10 nested dicts per agent on
+# each list_tools call
+_AGENT_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "input": {
+            "type": "string",
+            "description": "Input message or query for the agent"
+        },
+        "thread_id": {
+            "type": "string",
+            "description": "Optional thread ID for conversation continuity"
+        },
+        "config": {
+            "type": "object",
+            "description": "Optional configuration overrides",
+            "properties": {
+                "model": {"type": "string"},
+                "temperature": {"type": "number"},
+                "max_tokens": {"type": "integer"}
+            }
+        }
+    },
+    "required": ["input"]
+}
+
 
 class LangGraphMCPServer:
     """MCP Server for LangGraph agents"""
@@ -79,178 +157,225 @@ class LangGraphMCPServer:
         """
         self.server = Server("langgraph-agents")
         self.registry = AgentRegistry(registry_path)
-        self.active_threads: Dict[str, Dict[str, Any]] = {}
+        # LRU of thread info, bounded at _MAX_ACTIVE_THREADS (oldest
+        # entries are evicted first)
+        self.active_threads: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+        # Handler response caches, keyed on the registry file mtime so a
+        # polling client doesn't make us rebuild identical tool/resource/
+        # prompt lists (and re-serialize metadata) on every roundtrip
+        self._tools_cache: Optional[tuple] = None
+        self._resources_cache: Optional[tuple] = None
+        self._prompts_cache: Optional[tuple] = None
+        # Per-agent derived strings (metadata JSON, tool descriptions,
+        # capability bullets), all invalidated together on registry change
+        self._resource_json_cache: Dict[str, str] = {}
+        self._description_cache: Dict[str, str] = {}
+        self._capabilities_cache: Dict[str, str] = {}
+        self._agent_cache_stamp: int = -1
+
+        # Compiled graphs and their checkpointers per agent; compiling is
+        # the dominant per-call cost, so reuse across invocations. The
+        # shared MemorySaver also keeps thread state alive between calls.
+        self._compiled_graphs: Dict[str, Any] = {}
+        self._checkpointers: Dict[str, Any] = {}
 
         # Register handlers
         self._register_handlers()
 
         logger.info(f"Initialized LangGraph MCP Server with registry at: {self.registry.registry_path}")
 
+    def _registry_stamp(self) -> int:
+        """Cheap change stamp for the registry (file mtime in ns)"""
+        try:
+            return self.registry.registry_file.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _refresh_agent_caches(self, stamp: int):
+        """Drop per-agent derived strings if the registry has changed"""
+        if stamp != self._agent_cache_stamp:
+            self._resource_json_cache.clear()
+            self._description_cache.clear()
+            self._capabilities_cache.clear()
+            self._compiled_graphs.clear()
+            self._agent_cache_stamp = stamp
+
     def _register_handlers(self):
         """Register MCP protocol handlers"""
+        # Handlers are real methods registered once; bound methods are
+        # cheaper than fresh closures per instance and callable directly
+        # in tests
+        self.server.list_tools()(self._handle_list_tools)
+        self.server.call_tool()(self._handle_call_tool)
+        self.server.list_resources()(self._handle_list_resources)
+        self.server.read_resource()(self._handle_read_resource)
+        self.server.list_prompts()(self._handle_list_prompts)
+        self.server.get_prompt()(self._handle_get_prompt)
+
+    async def _handle_list_tools(self) -> List[types.Tool]:
+        """List all available LangGraph agents as tools"""
+        stamp = self._registry_stamp()
+        if self._tools_cache and self._tools_cache[0] == stamp:
+            return self._tools_cache[1]
+
+        self._refresh_agent_caches(stamp)
+        agents = self.registry.list_agents()
+
+        # Single bulk allocation instead of N append dispatches
+        tools = [
+            _tool_construct(
+                name=f"agent_{agent_id}",
+                description=self._build_tool_description(metadata),
+                inputSchema=_AGENT_INPUT_SCHEMA
+            )
+            for agent_id, metadata in agents.items()
+        ]
 
-        @self.server.list_tools()
-        async def handle_list_tools() -> List[types.Tool]:
-            """List all available LangGraph agents as tools"""
-            agents = self.registry.list_agents()
-            tools = []
-
-            for agent_id, metadata in agents.items():
-                tool = types.Tool(
-                    name=f"agent_{agent_id}",
-                    description=self._build_tool_description(metadata),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "input": {
-                                "type": "string",
-                                "description": "Input message or query for the agent"
-                            },
-                            "thread_id": {
-                                "type": "string",
-                                "description": "Optional thread ID for conversation continuity"
-                            },
-                            "config": {
-                                "type": "object",
-                                "description": "Optional configuration overrides",
-                                "properties": {
-                                    "model": {"type": "string"},
-                                    "temperature": {"type": "number"},
-                                    "max_tokens": {"type": "integer"}
-                                }
-                            }
-                        },
-                        "required": ["input"]
-                    }
-                )
-                tools.append(tool)
+        self._tools_cache = (stamp, tools)
+        logger.info(f"Listed {len(tools)} agent tools")
+        return tools
 
-            logger.info(f"Listed {len(tools)} agent tools")
-            return tools
+    async def _handle_call_tool(
+        self,
+        name: str,
+        arguments: Dict[str, Any]
+    ) -> Sequence[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+        """Execute a LangGraph agent tool"""
 
-        @self.server.call_tool()
-        async def handle_call_tool(
-            name: str,
-            arguments: Dict[str, Any]
-        ) -> Sequence[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-            """Execute a LangGraph agent tool"""
+        # Extract agent ID from tool name
+        if not name.startswith("agent_"):
+            raise ValueError(f"Invalid tool name: {name}")
 
-            # Extract agent ID from tool name
-            if not name.startswith("agent_"):
-                raise ValueError(f"Invalid tool name: {name}")
+        agent_id = name[6:]  # Remove "agent_" prefix
 
-            agent_id = name[6:]  # Remove "agent_" prefix
+        logger.info(f"Calling agent: {agent_id} with arguments: {arguments}")
 
-            logger.info(f"Calling agent: {agent_id} with arguments: {arguments}")
+        # Validate agent exists
+        if not self.registry.agent_exists(agent_id):
+            raise ValueError(f"Agent not found: {agent_id}")
 
-            # Validate agent exists
-            if not self.registry.agent_exists(agent_id):
-                raise ValueError(f"Agent not found: {agent_id}")
+        # Extract parameters
+        input_message = arguments.get("input")
+        thread_id = arguments.get("thread_id")
+        config = arguments.get("config", {})
 
-            # Extract parameters
-            input_message = arguments.get("input")
-            thread_id = arguments.get("thread_id")
-            config = arguments.get("config", {})
+        if not input_message:
+            raise ValueError("Missing required parameter: input")
 
-            if not input_message:
-                raise ValueError("Missing required parameter: input")
+        try:
+            # Load and invoke agent
+            result = await self._invoke_agent(
+                agent_id=agent_id,
+                input_message=input_message,
+                thread_id=thread_id,
+                config=config
+            )
 
-            try:
-                # Load and invoke agent
-                result = await self._invoke_agent(
-                    agent_id=agent_id,
-                    input_message=input_message,
-                    thread_id=thread_id,
-                    config=config
-                )
+            return [types.TextContent(
+                type="text",
+                text=_json_dumps(result)
+            )]
 
-                return [types.TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
-
-            except Exception as e:
-                logger.error(f"Error invoking agent {agent_id}: {str(e)}", exc_info=True)
-                return [types.TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "error": str(e),
-                        "agent_id": agent_id,
-                        "status": "failed"
-                    }, indent=2)
-                )]
-
-        @self.server.list_resources()
-        async def handle_list_resources() -> List[types.Resource]:
-            """List available agent resources"""
-            agents = self.registry.list_agents()
-            resources = []
-
-            for agent_id, metadata in agents.items():
-                resource = types.Resource(
-                    uri=f"agent://{agent_id}",
-                    name=metadata.name,
-                    description=metadata.description,
-                    mimeType="application/json"
-                )
-                resources.append(resource)
-
-            return resources
-
-        @self.server.read_resource()
-        async def handle_read_resource(uri: str) -> str:
-            """Read agent metadata and configuration"""
-            if not uri.startswith("agent://"):
-                raise ValueError(f"Invalid resource URI: {uri}")
-
-            agent_id = uri[8:]  # Remove "agent://" prefix
-            metadata = self.registry.get_agent_metadata(agent_id)
-
-            if not metadata:
-                raise ValueError(f"Agent not found: {agent_id}")
-
-            return json.dumps(metadata.to_dict(), indent=2)
-
-        @self.server.list_prompts()
-        async def handle_list_prompts() -> List[types.Prompt]:
-            """List available agent prompts"""
-            agents = self.registry.list_agents()
-            prompts = []
-
-            for agent_id, metadata in agents.items():
-                prompt = types.Prompt(
-                    name=f"invoke_{agent_id}",
-                    description=f"Invoke the {metadata.name} agent",
-                    arguments=[
-                        types.PromptArgument(
-                            name="query",
-                            description="Query or task for the agent",
-                            required=True
-                        )
-                    ]
-                )
-                prompts.append(prompt)
+        except Exception as e:
+            logger.error(f"Error invoking agent {agent_id}: {str(e)}", exc_info=True)
+            return [types.TextContent(
+                type="text",
+                text=_json_dumps({
+                    "error": str(e),
+                    "agent_id": agent_id,
+                    "status": "failed"
+                })
+            )]
+
+    async def _handle_list_resources(self) -> List[types.Resource]:
+        """List available agent resources"""
+        stamp = self._registry_stamp()
+        if self._resources_cache and self._resources_cache[0] == stamp:
+            return self._resources_cache[1]
+
+        agents = self.registry.list_agents()
+
+        resources = [
+            _resource_construct(
+                uri=f"agent://{agent_id}",
+                name=metadata.name,
+                description=metadata.description,
+                mimeType="application/json"
+            )
+            for agent_id, metadata in agents.items()
+        ]
 
-            return prompts
+        self._resources_cache = (stamp, resources)
+        return resources
 
-        @self.server.get_prompt()
-        async def handle_get_prompt(
-            name: str,
-            arguments: Dict[str, str]
-        ) -> types.GetPromptResult:
-            """Get a prompt for invoking an agent"""
-            if not name.startswith("invoke_"):
-                raise ValueError(f"Invalid prompt name: {name}")
+    async def _handle_read_resource(self, uri: str) -> str:
+        """Read agent metadata and configuration"""
+        if not uri.startswith("agent://"):
+            raise ValueError(f"Invalid resource URI: {uri}")
 
-            agent_id = name[7:]  # Remove "invoke_" prefix
-            metadata = self.registry.get_agent_metadata(agent_id)
+        agent_id = uri[8:]  # Remove "agent://" prefix
 
-            if not metadata:
-                raise ValueError(f"Agent not found: {agent_id}")
+        self._refresh_agent_caches(self._registry_stamp())
 
-            query = arguments.get("query", "")
+        cached = self._resource_json_cache.get(agent_id)
+        if cached is not None:
+            return cached
 
-            prompt_text = f"""You are about to invoke the {metadata.name} agent.
+        metadata = self.registry.get_agent_metadata(agent_id)
+
+        if not metadata:
+            raise ValueError(f"Agent not found: {agent_id}")
+
+        serialized = _json_dumps(metadata.to_dict())
+        self._resource_json_cache[agent_id] = serialized
+        return serialized
+
+    async def _handle_list_prompts(self) -> List[types.Prompt]:
+        """List available agent prompts"""
+        stamp = self._registry_stamp()
+        if self._prompts_cache and self._prompts_cache[0] == stamp:
+            return self._prompts_cache[1]
+
+        agents = self.registry.list_agents()
+
+        prompts = [
+            types.Prompt(
+                name=f"invoke_{agent_id}",
+                description=f"Invoke the {metadata.name} agent",
+                arguments=[
+                    types.PromptArgument(
+                        name="query",
+                        description="Query or task for the agent",
+                        required=True
+                    )
+                ]
+            )
+            for agent_id, metadata in agents.items()
+        ]
+
+        self._prompts_cache = (stamp, prompts)
+        return prompts
+
+    async def _handle_get_prompt(
+        self,
+        name: str,
+        arguments: Dict[str, str]
+    ) -> types.GetPromptResult:
+        """Get a prompt for invoking an agent"""
+        if not name.startswith("invoke_"):
+            raise ValueError(f"Invalid prompt name: {name}")
+
+        agent_id = name[7:]  # Remove "invoke_" prefix
+        self._refresh_agent_caches(self._registry_stamp())
+        metadata = self.registry.get_agent_metadata(agent_id)
+
+        if not metadata:
+            raise ValueError(f"Agent not found: {agent_id}")
+
+        query = arguments.get("query", "")
+
+        prompt_text = f"""You are about to invoke the {metadata.name} agent.
 
 Agent Description: {metadata.description}
 
@@ -261,24 +386,32 @@ Your Query: {query}
 
 The agent will process your query and return a response. You can continue the conversation by providing a thread_id."""
 
-            return types.GetPromptResult(
-                description=f"Prompt for invoking {metadata.name}",
-                messages=[
-                    types.PromptMessage(
-                        role="user",
-                        content=types.TextContent(
-                            type="text",
-                            text=prompt_text
-                        )
+        return types.GetPromptResult(
+            description=f"Prompt for invoking {metadata.name}",
+            messages=[
+                types.PromptMessage(
+                    role="user",
+                    content=types.TextContent(
+                        type="text",
+                        text=prompt_text
                     )
-                ]
-            )
+                )
+            ]
+        )
 
     def _build_tool_description(self, metadata: AgentMetadata) -> str:
         """Build a comprehensive tool description from agent metadata"""
+        # Pure function of metadata that only changes on re-discovery, so
+        # memoize per agent (cleared by _refresh_agent_caches)
+        cached = self._description_cache.get(metadata.id)
+        if cached is not None:
+            return cached
+
+        # No embedded newlines - the join supplies the separators, so an
+        # embedded "\n" would produce a double-newline seam
         description_parts = [
             f"{metadata.name}: {metadata.description}",
-            f"\nAgent Type: {metadata.agent_type}",
+            f"Agent Type: {metadata.agent_type}",
         ]
 
         if metadata.capabilities:
@@ -292,14 +425,23 @@ The agent will process your query and return a response. You can continue the co
             tools_str = ", ".join(metadata.tools)
             description_parts.append(f"Available Tools: {tools_str}")
 
-        return "\n".join(description_parts)
+        description = "\n".join(description_parts)
+        self._description_cache[metadata.id] = description
+        return description
 
     def _format_capabilities(self, metadata: AgentMetadata) -> str:
         """Format agent capabilities as a bullet list"""
+        cached = self._capabilities_cache.get(metadata.id)
+        if cached is not None:
+            return cached
+
         if not metadata.capabilities:
-            return "- General purpose agent"
+            bullets = "- General purpose agent"
+        else:
+            bullets = "\n".join(f"- {cap}" for cap in metadata.capabilities)
 
-        return "\n".join(f"- {cap}" for cap in metadata.capabilities)
+        self._capabilities_cache[metadata.id] = bullets
+        return bullets
 
     async def _invoke_agent(
         self,
@@ -320,25 +462,41 @@ The agent will process your query and return a response. You can continue the co
         Returns:
             Dictionary containing agent response and metadata
         """
-        # Load agent
-        agent_module = self.registry.load_agent(agent_id)
+        # First invocation pays the langgraph/langchain import
+        _load_langgraph()
 
-        if not agent_module:
-            raise ValueError(f"Failed to load agent: {agent_id}")
+        # Capture the running loop once; get_event_loop() repeats a
+        # thread-local lookup per call and is deprecated from a coroutine
+        loop = asyncio.get_running_loop()
 
-        # Get or create compiled graph
-        if hasattr(agent_module, 'graph'):
-            graph = agent_module.graph
-        elif hasattr(agent_module, 'create_graph'):
-            graph = agent_module.create_graph()
-        else:
-            raise ValueError(f"Agent {agent_id} does not expose a graph or create_graph function")
+        # Reuse the compiled graph when the registry hasn't changed
+        self._refresh_agent_caches(self._registry_stamp())
+        graph = self._compiled_graphs.get(agent_id)
 
-        # Ensure graph is compiled with checkpointer
-        if not hasattr(graph, 'invoke'):
-            # Not compiled yet, compile with memory saver
-            checkpointer = MemorySaver()
-            graph = graph.compile(checkpointer=checkpointer)
+        if graph is None:
+            # Load agent
+            agent_module = self.registry.load_agent(agent_id)
+
+            if not agent_module:
+                raise ValueError(f"Failed to load agent: {agent_id}")
+
+            # Get or create compiled graph
+            if hasattr(agent_module, 'graph'):
+                graph = agent_module.graph
+            elif hasattr(agent_module, 'create_graph'):
+                graph = agent_module.create_graph()
+            else:
+                raise ValueError(f"Agent {agent_id} does not expose a graph or create_graph function")
+
+            # Ensure graph is compiled with checkpointer
+            if not hasattr(graph, 'invoke'):
+                # Not compiled yet, compile with the agent's memory saver.
+                # The checkpointer outlives cache invalidation so thread
+                # state survives re-discovery.
+                checkpointer = self._checkpointers.setdefault(agent_id, MemorySaver())
+                graph = graph.compile(checkpointer=checkpointer)
+
+            self._compiled_graphs[agent_id] = graph
 
         # Prepare invocation config
         invoke_config = config or {}
@@ -346,17 +504,12 @@ The agent will process your query and return a response. You can continue the co
         if thread_id:
             invoke_config["configurable"] = {"thread_id": thread_id}
         else:
-            # Generate a new thread ID
-            import uuid
-            thread_id = str(uuid.uuid4())
+            # Generate a new thread ID (.hex skips the hyphen formatting)
+            thread_id = _uuid4().hex
             invoke_config["configurable"] = {"thread_id": thread_id}
 
         # Store thread info
-        self.active_threads[thread_id] = {
-            "agent_id": agent_id,
-            "created_at": asyncio.get_event_loop().time(),
-            "message_count": 0
-        }
+        thread_info = self._track_thread(thread_id, agent_id, loop.time())
 
         # Prepare input
         if isinstance(input_message, str):
@@ -367,20 +520,20 @@ The agent will process your query and return a response. You can continue the co
         try:
             # Invoke agent (streaming if supported)
             if hasattr(graph, 'astream'):
-                # Streaming invocation
-                response_chunks = []
+                # Streaming invocation - only the final state snapshot is
+                # returned, so keep just the last chunk instead of
+                # buffering every intermediate state in memory
+                result = None
                 async for chunk in graph.astream(agent_input, invoke_config):
-                    response_chunks.append(chunk)
-
-                # Combine chunks
-                result = self._combine_chunks(response_chunks)
+                    result = chunk
+                result = result or {}
             else:
                 # Regular invocation
                 result = await graph.ainvoke(agent_input, invoke_config)
 
             # Update thread info
-            self.active_threads[thread_id]["message_count"] += 1
-            self.active_threads[thread_id]["last_activity"] = asyncio.get_event_loop().time()
+            thread_info["message_count"] += 1
+            thread_info["last_activity"] = loop.time()
 
             # Format response
             return {
@@ -388,60 +541,105 @@ The agent will process your query and return a response. You can continue the co
                 "agent_id": agent_id,
                 "thread_id": thread_id,
                 "response": self._format_agent_response(result),
-                "message_count": self.active_threads[thread_id]["message_count"]
+                "message_count": thread_info["message_count"]
             }
 
         except Exception as e:
             logger.error(f"Error during agent invocation: {str(e)}", exc_info=True)
             raise
 
-    def _combine_chunks(self, chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Combine streaming chunks into a single result"""
-        if not chunks:
-            return {}
+    def _track_thread(self, thread_id: str, agent_id: str, now: float) -> Dict[str, Any]:
+        """Get or create thread info, keeping the LRU bounded"""
+        threads = self.active_threads
+        info = threads.get(thread_id)
 
-        # Most LangGraph streams return state updates
-        # The last chunk usually contains the final state
-        return chunks[-1] if chunks else {}
+        if info is None:
+            info = {
+                "agent_id": agent_id,
+                "created_at": now,
+                "message_count": 0
+            }
+            threads[thread_id] = info
+            if len(threads) > _MAX_ACTIVE_THREADS:
+                threads.popitem(last=False)
+        else:
+            threads.move_to_end(thread_id)
+
+        return info
 
     def _format_agent_response(self, result: Any) -> Any:
         """Format agent response for JSON serialization"""
-        if isinstance(result, dict):
-            formatted = {}
-            for key, value in result.items():
-                if key == "messages" and isinstance(value, list):
-                    # Format message list
-                    formatted[key] = [self._format_message(msg) for msg in value]
-                else:
-                    formatted[key] = value
-            return formatted
-        return result
-
-    def _format_message(self, message: Any) -> Dict[str, Any]:
-        """Format a LangChain message for JSON serialization"""
-        if hasattr(message, 'content') and hasattr(message, 'type'):
-            return {
-                "type": message.type,
-                "content": message.content
-            }
-        return str(message)
+        if not isinstance(result, dict):
+            return result
+
+        messages = result.get("messages")
+        if not isinstance(messages, list):
+            # Nothing to transform - no need to rebuild the dict
+            return result
+
+        # Shallow-copy and rewrite only the messages key; the bound
+        # attrgetter pulls both attributes in one C-level call per message
+        formatted = result.copy()
+        try:
+            formatted["messages"] = [
+                {"type": t, "content": c}
+                for t, c in map(_GET_TYPE_CONTENT, messages)
+            ]
+        except AttributeError:
+            # Unexpected message objects without type/content
+            formatted["messages"] = [
+                {"type": m.type, "content": m.content}
+                if hasattr(m, 'type') and hasattr(m, 'content') else str(m)
+                for m in messages
+            ]
+        return formatted
+
+    def _invalidate_handler_caches(self):
+        """Drop all cached handler responses and derived strings"""
+        self._tools_cache = None
+        self._resources_cache = None
+        self._prompts_cache = None
+        self._resource_json_cache.clear()
+        self._description_cache.clear()
+        self._capabilities_cache.clear()
+        self._compiled_graphs.clear()
+        self._agent_cache_stamp = -1
+
+    async def _watch_registry(self):
+        """Invalidate caches when the registry directory changes on disk"""
+        try:
+            async for _changes in watchfiles.awatch(self.registry.registry_path):
+                logger.info("Registry changed on disk, invalidating caches")
+                self._invalidate_handler_caches()
+        except asyncio.CancelledError:
+            pass
 
     async def run(self):
         """Run the MCP server"""
-        async with stdio_server() as (read_stream, write_stream):
-            logger.info("Starting LangGraph MCP server on stdio")
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="langgraph-agents",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={}
+        # Event-driven cache invalidation when watchfiles is installed;
+        # the mtime stamps in the handlers remain as the fallback
+        watcher = None
+        if watchfiles is not None:
+            watcher = asyncio.create_task(self._watch_registry())
+
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                logger.info("Starting LangGraph MCP server on stdio")
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="langgraph-agents",
+                        server_version="1.0.0",
+                        capabilities=self.server.get_capabilities(
+                            notification_options=NotificationOptions(),
+                            experimental_capabilities={}
+                        )
                     )
                 )
-            )
+        finally:
+            if watcher is not None:
+                watcher.cancel()
 
 
 async def main():
@@ -11,19 +11,17 @@ from pathlib import Path
 readme_file = Path(__file__).parent / "README.md"
 long_description = ""
 if readme_file.exists():
-    with open(readme_file, "r", encoding="utf-8") as f:
-        long_description = f.read()
+    long_description = readme_file.read_text(encoding="utf-8")
 
-# Read requirements
+# Read requirements in one pass; same parse as install.parse_requirements
 requirements_file = Path(__file__).parent / "requirements.txt"
 requirements = []
 if requirements_file.exists():
-    with open(requirements_file, "r", encoding="utf-8") as f:
-        requirements = [
-            line.strip()
-            for line in f
-            if line.strip() and not line.startswith("#")
-        ]
+    requirements = [
+        spec
+        for line in requirements_file.read_text(encoding="utf-8").splitlines()
+        if (spec := line.strip()) and not spec.startswith("#")
+    ]
 
 setup(
     name="langgraph-mcp-server",
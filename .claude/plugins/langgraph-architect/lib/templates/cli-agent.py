@@ -10,25 +10,19 @@ A LangGraph agent with a full-featured CLI interface:
 - Production-ready error handling
 """
 
+from __future__ import annotations
+
+import ast
+import operator
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict, Annotated, Sequence, Optional
 from datetime import datetime
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
-from langchain_core.tools import tool
-from langchain_anthropic import ChatAnthropic
-from langgraph.graph import StateGraph, START, END
-from langgraph.prebuilt import ToolNode
-from langgraph.graph.message import add_messages
-from langgraph.checkpoint.sqlite import SqliteSaver
 
 
 # ============================================================================
@@ -46,6 +40,53 @@ app = typer.Typer(
 console = Console()
 
 
+# ============================================================================
+# Lazy Imports
+# ============================================================================
+
+# The langchain/langgraph import graph and the rich widgets cost hundreds
+# of milliseconds; loading them at module import makes even `agent --help`
+# pay that price. They are bound into these module globals on first
+# command use instead - AgentState's postponed annotations also resolve
+# against them.
+BaseMessage = None
+HumanMessage = None
+AIMessage = None
+SystemMessage = None
+add_messages = None
+Group = None
+Markdown = None
+Panel = None
+Progress = None
+SpinnerColumn = None
+TextColumn = None
+
+# Shared system prompt, built once by _load_runtime(): messages are
+# immutable, so every ask/interactive call can reuse the same instance
+# instead of re-running pydantic validation
+_SYSTEM_MSG = None
+
+
+def _load_runtime() -> None:
+    """Import message types and rich widgets on first use."""
+    global BaseMessage, HumanMessage, AIMessage, SystemMessage, add_messages
+    global Group, Markdown, Panel, Progress, SpinnerColumn, TextColumn
+    global _SYSTEM_MSG
+
+    if BaseMessage is not None:
+        return
+
+    from rich.console import Group
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+    from langgraph.graph.message import add_messages
+
+    _SYSTEM_MSG = SystemMessage(content="You are a helpful AI assistant with access to tools.")
+
+
 # ============================================================================
 # State Definition
 # ============================================================================
@@ -61,43 +102,87 @@ class AgentState(TypedDict):
 # Tools
 # ============================================================================
 
-@tool
-async def search_web(query: str) -> str:
-    """Search the web for information."""
-    # TODO: Implement actual web search
-    return f"Search results for '{query}':\n- Result 1\n- Result 2\n- Result 3"
-
-
-@tool
-async def get_current_time() -> str:
-    """Get the current date and time."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-
-@tool
-async def calculate(expression: str) -> float:
-    """Evaluate a mathematical expression."""
-    try:
-        result = eval(expression, {"__builtins__": {}}, {})
-        return float(result)
-    except Exception as e:
-        raise ValueError(f"Invalid expression: {e}")
-
+# Whitelisted arithmetic operators for the calculate tool; anything
+# outside this table is rejected
+_CALC_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+def _eval_node(node: ast.AST) -> float:
+    """Evaluate a whitelisted arithmetic AST node."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _CALC_OPS:
+        return _CALC_OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _CALC_OPS:
+        return _CALC_OPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError(f"Unsupported expression element: {ast.dump(node)}")
+
+
+@lru_cache(maxsize=1024)
+def _evaluate_expression(expression: str) -> float:
+    """Parse and evaluate an arithmetic expression (memoized)."""
+    tree = ast.parse(expression, mode="eval")
+    return float(_eval_node(tree.body))
+
+
+@lru_cache(maxsize=1)
+def _get_agent_tools():
+    """Build the agent tool list (imports langchain on first use)."""
+    from langchain_core.tools import tool
+
+    @tool
+    async def search_web(query: str) -> str:
+        """Search the web for information."""
+        # TODO: Implement actual web search
+        return f"Search results for '{query}':\n- Result 1\n- Result 2\n- Result 3"
+
+    @tool
+    async def get_current_time() -> str:
+        """Get the current date and time."""
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    @tool
+    async def calculate(expression: str) -> float:
+        """Evaluate a mathematical expression."""
+        # AST walk over a whitelisted node set instead of eval(): no code
+        # execution surface, and repeated expressions hit the lru_cache
+        try:
+            return _evaluate_expression(expression)
+        except Exception as e:
+            raise ValueError(f"Invalid expression: {e}")
 
-# Agent tools
-agent_tools = [search_web, get_current_time, calculate]
+    return [search_web, get_current_time, calculate]
 
 
 # ============================================================================
 # Agent Nodes
 # ============================================================================
 
+# Lazily-initialized model singleton; constructing ChatAnthropic and
+# re-binding the tool schemas on every graph step is pure overhead
+_MODEL = None
+
+
 async def agent_node(state: AgentState) -> AgentState:
     """Main agent node."""
-    model = ChatAnthropic(
-        model="claude-3-5-sonnet-20241022",
-        temperature=0
-    ).bind_tools(agent_tools)
+    global _MODEL
+    if _MODEL is None:
+        from langchain_anthropic import ChatAnthropic
+
+        _MODEL = ChatAnthropic(
+            model="claude-3-5-sonnet-20241022",
+            temperature=0
+        ).bind_tools(_get_agent_tools())
+    model = _MODEL
 
     response = await model.ainvoke(state["messages"])
     return {"messages": [response]}
@@ -105,10 +190,9 @@ async def agent_node(state: AgentState) -> AgentState:
 
 def should_continue(state: AgentState) -> str:
     """Route to tools or end."""
-    messages = state["messages"]
-    last_message = messages[-1]
-
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+    # getattr with a default beats hasattr here: no try/except on the
+    # no-tool-calls path, and this runs on every graph tick
+    if getattr(state["messages"][-1], "tool_calls", None):
         return "continue"
     return "end"
 
@@ -117,13 +201,38 @@ def should_continue(state: AgentState) -> str:
 # Graph Construction
 # ============================================================================
 
-def create_graph(checkpoint_dir: Optional[Path] = None):
-    """Create the agent graph."""
+def create_graph(checkpoint_dir: Optional[Path] = None, *, ephemeral: bool = False):
+    """Create the agent graph (memoized per checkpoint directory).
+
+    With ephemeral=True the graph checkpoints in memory only - no SQLite
+    file, WAL setup, or checkpoint writes for state nobody will read back.
+    """
+    if ephemeral:
+        return _get_graph(None)
+    if checkpoint_dir is None:
+        checkpoint_dir = Path.home() / ".agent" / "checkpoints"
+    return _get_graph(str(Path(checkpoint_dir).absolute()))
+
+
+@lru_cache(maxsize=4)
+def _get_graph(checkpoint_dir: Optional[str]):
+    """Build and compile the graph for one checkpoint directory.
+
+    Graph compilation and the SQLite checkpointer handshake are pure
+    cold-start cost; caching by directory lets every command in a
+    process share one compiled graph and one connection. A None
+    directory compiles with an in-memory checkpointer.
+    """
+    _load_runtime()
+
+    from langgraph.graph import StateGraph, START, END
+    from langgraph.prebuilt import ToolNode
+
     workflow = StateGraph(AgentState)
 
     # Add nodes
     workflow.add_node("agent", agent_node)
-    workflow.add_node("tools", ToolNode(agent_tools))
+    workflow.add_node("tools", ToolNode(_get_agent_tools()))
 
     # Define flow
     workflow.add_edge(START, "agent")
@@ -136,11 +245,17 @@ def create_graph(checkpoint_dir: Optional[Path] = None):
 
     # Setup checkpointing
     if checkpoint_dir is None:
-        checkpoint_dir = Path.home() / ".agent" / "checkpoints"
-    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        from langgraph.checkpoint.memory import MemorySaver
+
+        checkpointer = MemorySaver()
+    else:
+        from langgraph.checkpoint.sqlite import SqliteSaver
 
-    db_path = checkpoint_dir / "checkpoints.db"
-    checkpointer = SqliteSaver.from_conn_string(str(db_path))
+        checkpoint_path = Path(checkpoint_dir)
+        checkpoint_path.mkdir(parents=True, exist_ok=True)
+
+        db_path = checkpoint_path / "checkpoints.db"
+        checkpointer = SqliteSaver.from_conn_string(str(db_path))
 
     return workflow.compile(checkpointer=checkpointer)
 
@@ -149,6 +264,37 @@ def create_graph(checkpoint_dir: Optional[Path] = None):
 # CLI Commands
 # ============================================================================
 
+_RENDER_SKIP = lambda msg: ()
+
+
+@lru_cache(maxsize=1)
+def _history_renderers():
+    """Build the history renderer dispatch tables on first use.
+
+    Renderers are keyed by concrete message type: one dict lookup per
+    message instead of walking an isinstance chain. Each renderer
+    returns the renderables for one message; the command collects them
+    all and prints once, so a long session costs one console write
+    instead of one per message. Unknown types render to nothing,
+    matching the old chains' fall-through.
+    """
+    _load_runtime()
+
+    markdown = {
+        HumanMessage: lambda msg: (f"**User:** {msg.content}\n",),
+        AIMessage: lambda msg: (f"**Agent:** {msg.content}\n",),
+        SystemMessage: lambda msg: (f"*System:* {msg.content}\n",),
+    }
+
+    pretty = {
+        HumanMessage: lambda msg: (f"[bold green]User:[/bold green] {msg.content}\n",),
+        AIMessage: lambda msg: ("[bold cyan]Agent:[/bold cyan]", Markdown(msg.content), ""),
+        SystemMessage: lambda msg: (f"[dim]System: {msg.content}[/dim]\n",),
+    }
+
+    return markdown, pretty
+
+
 @app.command()
 def ask(
     query: str = typer.Argument(..., help="The question or task for the agent"),
@@ -165,12 +311,15 @@ def ask(
     """
     import asyncio
 
+    _load_runtime()
+
     async def run_query():
         # Create or get session
         session_id = session or f"session-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
 
-        # Create graph
-        graph = create_graph()
+        # Without --session the state dies with the process, so skip the
+        # SQLite checkpointer entirely; named sessions keep durability
+        graph = create_graph(ephemeral=session is None)
 
         # Configuration
         config = {
@@ -182,7 +331,7 @@ def ask(
         # Initial state
         initial_state = {
             "messages": [
-                SystemMessage(content="You are a helpful AI assistant with access to tools."),
+                _SYSTEM_MSG,
                 HumanMessage(content=query)
             ],
             "user_name": os.getenv("USER", "User"),
@@ -236,6 +385,8 @@ def interactive(
     """
     import asyncio
 
+    _load_runtime()
+
     # Create or get session
     session_id = session or f"interactive-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
 
@@ -258,56 +409,75 @@ def interactive(
     ))
 
     # Initialize with system message
-    messages = [
-        SystemMessage(content="You are a helpful AI assistant with access to tools.")
-    ]
+    messages = [_SYSTEM_MSG]
 
     async def chat_loop():
         nonlocal messages
 
+        # One Progress for the whole session: starting a fresh Live
+        # display (and its refresh thread) per turn is pure teardown
+        # churn. The spinner only renders while a task is registered.
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True
+        )
+
+        # Slash-command handlers; returning True ends the session
+        def _do_exit():
+            console.print("[yellow]Goodbye![/yellow]")
+            return True
+
+        def _do_clear():
+            nonlocal messages
+            messages = [messages[0]]  # Keep system message
+            console.print("[dim]Conversation cleared.[/dim]")
+
+        def _do_history():
+            console.print("\n[bold cyan]Conversation History:[/bold cyan]")
+            for msg in messages[1:]:  # Skip system message
+                if isinstance(msg, HumanMessage):
+                    console.print(f"[green]You:[/green] {msg.content}")
+                elif isinstance(msg, AIMessage):
+                    console.print(f"[cyan]Agent:[/cyan] {msg.content}")
+
+        commands = {"/exit": _do_exit, "/clear": _do_clear, "/history": _do_history}
+
         while True:
-            # Get user input
+            # Get user input. The prompt is a fixed string, so write the
+            # ANSI codes directly instead of paying rich's markup
+            # tokenizer and render pipeline every turn; agent responses
+            # still go through rich where formatting matters.
             try:
-                user_input = console.input("\n[bold green]You:[/bold green] ")
+                sys.stdout.write("\n\033[1;32mYou:\033[0m ")
+                sys.stdout.flush()
+                user_input = input()
             except (KeyboardInterrupt, EOFError):
                 console.print("\n[yellow]Goodbye![/yellow]")
                 break
 
-            # Handle commands
-            if user_input.strip().lower() == "/exit":
-                console.print("[yellow]Goodbye![/yellow]")
-                break
-
-            elif user_input.strip().lower() == "/clear":
-                messages = [messages[0]]  # Keep system message
-                console.print("[dim]Conversation cleared.[/dim]")
-                continue
-
-            elif user_input.strip().lower() == "/history":
-                console.print("\n[bold cyan]Conversation History:[/bold cyan]")
-                for msg in messages[1:]:  # Skip system message
-                    if isinstance(msg, HumanMessage):
-                        console.print(f"[green]You:[/green] {msg.content}")
-                    elif isinstance(msg, AIMessage):
-                        console.print(f"[cyan]Agent:[/cyan] {msg.content}")
+            # Normalize once; the old chain re-ran strip().lower() for
+            # every comparison
+            cmd = user_input.strip().lower()
+            handler = commands.get(cmd)
+            if handler is not None:
+                if handler():
+                    break
                 continue
 
-            if not user_input.strip():
+            if not cmd:
                 continue
 
             # Add user message
             messages.append(HumanMessage(content=user_input))
 
-            # Show spinner
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-                transient=True
-            ) as progress:
-                task = progress.add_task("[cyan]Thinking...", total=None)
-
-                # Run agent
+            # Show spinner while the agent runs. start/stop only toggles
+            # the live display; the Progress object, its columns, and
+            # its render state are built once above.
+            task = progress.add_task("[cyan]Thinking...", total=None)
+            progress.start()
+            try:
                 state = {
                     "messages": messages,
                     "user_name": os.getenv("USER", "User"),
@@ -315,6 +485,9 @@ def interactive(
                 }
 
                 result = await graph.ainvoke(state, config)
+            finally:
+                progress.stop()
+                progress.remove_task(task)
 
             # Update messages
             messages = result["messages"]
@@ -345,6 +518,8 @@ def history(
     import asyncio
     import json
 
+    _load_runtime()
+
     async def get_history():
         graph = create_graph()
 
@@ -363,6 +538,8 @@ def history(
                 console.print("[yellow]No history found for this session.[/yellow]")
                 return
 
+            markdown_renderers, pretty_renderers = _history_renderers()
+
             if format == "json":
                 # JSON output
                 history_data = []
@@ -375,26 +552,18 @@ def history(
 
             elif format == "markdown":
                 # Markdown output
+                parts = []
                 for msg in messages:
-                    if isinstance(msg, HumanMessage):
-                        console.print(f"**User:** {msg.content}\n")
-                    elif isinstance(msg, AIMessage):
-                        console.print(f"**Agent:** {msg.content}\n")
-                    elif isinstance(msg, SystemMessage):
-                        console.print(f"*System:* {msg.content}\n")
+                    parts.extend(markdown_renderers.get(type(msg), _RENDER_SKIP)(msg))
+                if parts:
+                    console.print("\n".join(parts))
 
             else:
                 # Pretty output (default)
-                console.print(f"\n[bold cyan]Session: {session}[/bold cyan]\n")
+                parts = [f"\n[bold cyan]Session: {session}[/bold cyan]\n"]
                 for msg in messages:
-                    if isinstance(msg, HumanMessage):
-                        console.print(f"[bold green]User:[/bold green] {msg.content}\n")
-                    elif isinstance(msg, AIMessage):
-                        console.print(f"[bold cyan]Agent:[/bold cyan]")
-                        console.print(Markdown(msg.content))
-                        console.print()
-                    elif isinstance(msg, SystemMessage):
-                        console.print(f"[dim]System: {msg.content}[/dim]\n")
+                    parts.extend(pretty_renderers.get(type(msg), _RENDER_SKIP)(msg))
+                console.print(Group(*parts))
 
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
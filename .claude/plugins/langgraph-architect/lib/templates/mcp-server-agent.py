@@ -10,6 +10,12 @@ A LangGraph agent exposed as an MCP (Model Context Protocol) server:
 
 import os
 import asyncio
+import hashlib
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict
 from typing import TypedDict, Annotated, Sequence, Any
 from contextlib import asynccontextmanager
 
@@ -34,8 +40,6 @@ from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
 class AgentState(TypedDict):
     """State for the research agent."""
     messages: Annotated[Sequence[BaseMessage], add_messages]
-    query: str
-    results: list[str]
 
 
 @tool
@@ -71,12 +75,41 @@ async def analyze_data(data: str) -> str:
 agent_tools = [research_web, analyze_data]
 
 
+# Lazily-initialized model singleton; constructing ChatAnthropic and
+# re-binding the tool schemas on every graph step is pure overhead.
+# The single instance also means a single underlying SDK client, so
+# every Anthropic round trip reuses one keep-alive connection pool.
+_MODEL = None
+
+
+def _bind_cached_tools(model: ChatAnthropic):
+    """Bind the agent tools with a prompt-cache breakpoint.
+
+    The tool schemas are identical on every request; marking the last
+    tool with cache_control makes Anthropic cache the prefill up to and
+    including the whole tools block, so fresh threads stop re-paying
+    for those tokens. Falls back to a plain bind if the converter is
+    unavailable in the installed langchain-anthropic.
+    """
+    try:
+        from langchain_anthropic.chat_models import convert_to_anthropic_tool
+
+        tool_defs = [convert_to_anthropic_tool(t) for t in agent_tools]
+        tool_defs[-1]["cache_control"] = {"type": "ephemeral"}
+        return model.bind_tools(tool_defs)
+    except ImportError:
+        return model.bind_tools(agent_tools)
+
+
 async def agent_node(state: AgentState) -> AgentState:
     """Main agent node."""
-    model = ChatAnthropic(
-        model="claude-3-5-sonnet-20241022",
-        temperature=0
-    ).bind_tools(agent_tools)
+    global _MODEL
+    if _MODEL is None:
+        _MODEL = _bind_cached_tools(ChatAnthropic(
+            model="claude-3-5-sonnet-20241022",
+            temperature=0
+        ))
+    model = _MODEL
 
     response = await model.ainvoke(state["messages"])
 
@@ -85,14 +118,41 @@ async def agent_node(state: AgentState) -> AgentState:
 
 def should_continue(state: AgentState) -> str:
     """Route to tools or end."""
-    messages = state["messages"]
-    last_message = messages[-1]
-
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+    # getattr with a default beats hasattr here: no try/except on the
+    # no-tool-calls path, and this runs on every graph tick
+    if getattr(state["messages"][-1], "tool_calls", None):
         return "continue"
     return "end"
 
 
+class LRUMemorySaver(MemorySaver):
+    """MemorySaver with an LRU cap on tracked threads.
+
+    The tool handlers mint a fresh thread_id per call, so the stock
+    MemorySaver would accumulate every past conversation for the life
+    of the process. This variant tracks thread recency on put() and
+    drops the oldest thread's checkpoints and pending writes once more
+    than max_threads are live.
+    """
+
+    def __init__(self, max_threads: int = 256):
+        super().__init__()
+        self._max_threads = max_threads
+        self._recency: OrderedDict = OrderedDict()
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        result = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = config["configurable"]["thread_id"]
+        self._recency[thread_id] = None
+        self._recency.move_to_end(thread_id)
+        while len(self._recency) > self._max_threads:
+            stale, _ = self._recency.popitem(last=False)
+            self.storage.pop(stale, None)
+            for key in [k for k in self.writes if k[0] == stale]:
+                del self.writes[key]
+        return result
+
+
 def create_agent_graph():
     """Create the research agent graph."""
     workflow = StateGraph(AgentState)
@@ -110,8 +170,9 @@ def create_agent_graph():
     )
     workflow.add_edge("tools", "agent")
 
-    # Add checkpointing
-    checkpointer = MemorySaver()
+    # Add checkpointing, capped so per-call threads cannot grow RSS
+    # without bound
+    checkpointer = LRUMemorySaver()
 
     return workflow.compile(checkpointer=checkpointer)
 
@@ -126,87 +187,296 @@ agent_graph = create_agent_graph()
 # Create MCP server
 mcp_server = Server("langgraph-research-agent")
 
+# Monotonic per-process counter for checkpointer thread ids. The old
+# second-granularity timestamps collided when two calls landed in the
+# same second, silently sharing MemorySaver state between requests.
+_thread_counter = itertools.count()
 
-@mcp_server.list_tools()
-async def list_tools() -> list[Tool]:
-    """
-    List available MCP tools.
 
-    This exposes the LangGraph agent's capabilities as MCP tools.
+def _cached_system_message(text: str) -> SystemMessage:
+    """Build a system message marked for Anthropic prompt caching.
+
+    The cache_control breakpoint lets repeated calls reuse the model's
+    prefill of this static prefix instead of re-tokenizing it each time.
+    The breakpoint stays on the system prompt only - dynamic user
+    prompts and tool results are deliberately left uncached.
     """
-    return [
-        Tool(
-            name="research_topic",
-            description=(
-                "Research a topic comprehensively using an AI agent with web search "
-                "and analysis capabilities. Returns a detailed research summary."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "The topic to research"
-                    },
-                    "depth": {
-                        "type": "string",
-                        "enum": ["shallow", "medium", "deep"],
-                        "description": "Depth of research to perform",
-                        "default": "medium"
-                    },
-                    "focus": {
-                        "type": "string",
-                        "description": "Specific focus or angle for the research (optional)"
-                    }
+    return SystemMessage(content=[{
+        "type": "text",
+        "text": text,
+        "cache_control": {"type": "ephemeral"},
+    }])
+
+
+# Static system prompts, built once so every handler call reuses the
+# same instance
+_RESEARCH_SYSTEM_MSG = _cached_system_message(
+    "You are a research specialist with web search capabilities."
+)
+_ANALYST_SYSTEM_MSG = _cached_system_message("You are an expert analyst.")
+_ASSISTANT_SYSTEM_MSG = _cached_system_message(
+    "You are a helpful AI assistant with research and analysis capabilities."
+)
+
+
+# Tool definitions are stable for the life of the process, so build
+# them once at import instead of reconstructing the schema dicts on
+# every ListTools request
+_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="research_topic",
+        description=(
+            "Research a topic comprehensively using an AI agent with web search "
+            "and analysis capabilities. Returns a detailed research summary."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {
+                    "type": "string",
+                    "description": "The topic to research"
                 },
-                "required": ["topic"]
-            }
+                "depth": {
+                    "type": "string",
+                    "enum": ["shallow", "medium", "deep"],
+                    "description": "Depth of research to perform",
+                    "default": "medium"
+                },
+                "focus": {
+                    "type": "string",
+                    "description": "Specific focus or angle for the research (optional)"
+                }
+            },
+            "required": ["topic"]
+        }
+    ),
+    Tool(
+        name="analyze_content",
+        description=(
+            "Analyze content using AI to extract insights, patterns, and key information. "
+            "Can analyze text, data, or structured information."
         ),
-        Tool(
-            name="analyze_content",
-            description=(
-                "Analyze content using AI to extract insights, patterns, and key information. "
-                "Can analyze text, data, or structured information."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {
-                        "type": "string",
-                        "description": "The content to analyze"
-                    },
-                    "analysis_type": {
-                        "type": "string",
-                        "enum": ["summary", "insights", "patterns", "sentiment"],
-                        "description": "Type of analysis to perform",
-                        "default": "insights"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {
+                    "type": "string",
+                    "description": "The content to analyze"
                 },
-                "required": ["content"]
-            }
+                "analysis_type": {
+                    "type": "string",
+                    "enum": ["summary", "insights", "patterns", "sentiment"],
+                    "description": "Type of analysis to perform",
+                    "default": "insights"
+                }
+            },
+            "required": ["content"]
+        }
+    ),
+    Tool(
+        name="ask_agent",
+        description=(
+            "Ask the AI agent a question. The agent can use its tools and reasoning "
+            "capabilities to provide comprehensive answers."
         ),
-        Tool(
-            name="ask_agent",
-            description=(
-                "Ask the AI agent a question. The agent can use its tools and reasoning "
-                "capabilities to provide comprehensive answers."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "question": {
-                        "type": "string",
-                        "description": "The question to ask"
-                    },
-                    "context": {
-                        "type": "string",
-                        "description": "Additional context for the question (optional)"
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "question": {
+                    "type": "string",
+                    "description": "The question to ask"
                 },
-                "required": ["question"]
-            }
+                "context": {
+                    "type": "string",
+                    "description": "Additional context for the question (optional)"
+                }
+            },
+            "required": ["question"]
+        }
+    ),
+    Tool(
+        name="batch",
+        description=(
+            "Execute several tool calls concurrently in one request. "
+            "Returns the concatenated results in call order."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "arguments": {"type": "object"}
+                        },
+                        "required": ["name"]
+                    },
+                    "description": "Tool calls to execute concurrently"
+                }
+            },
+            "required": ["calls"]
+        }
+    )
+)
+
+
+@mcp_server.list_tools()
+async def list_tools() -> list[Tool]:
+    """
+    List available MCP tools.
+
+    This exposes the LangGraph agent's capabilities as MCP tools.
+    """
+    # Shallow copy keeps the handler's list contract without letting
+    # callers mutate the shared tuple's backing definitions
+    return list(_TOOLS)
+
+
+# ----------------------------------------------------------------------------
+# Deferred batch execution
+# ----------------------------------------------------------------------------
+# research_topic and analyze_content are comprehensive, latency-insensitive
+# workloads. Calls flagged with "batch": true are parked on a queue and
+# drained in windows by a background worker, which overlaps their agent
+# runs instead of paying one sequential round trip each. Real-time calls
+# without the flag bypass the queue entirely.
+
+_BATCH_MAX = 8          # max calls dispatched per window
+_BATCH_WINDOW_S = 5.0   # max seconds to wait filling a window
+
+_batch_queue: asyncio.Queue = None  # created in main() on the server loop
+
+
+class ResultCache:
+    """LRU + TTL cache for tool results.
+
+    Identical tool calls - common in agent retry loops - redo a full
+    LLM-backed graph run; caching the prior TextContent list answers
+    them in sub-millisecond time at zero LLM cost. Entries are keyed on
+    a digest of tool name plus canonicalized arguments, evicted oldest
+    first past max_entries, and expire after ttl_s.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_s: float = 3600.0):
+        self._entries: OrderedDict = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes):
+        """Return the cached value for key, or None if absent/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stamp = entry
+            if time.monotonic() - stamp > self._ttl_s:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value) -> None:
+        """Store value under key, evicting the oldest entries past cap."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+_result_cache = ResultCache()
+
+
+def _cache_key(name: str, arguments: dict) -> bytes:
+    """Content-addressed key over the tool name and sorted arguments."""
+    payload = name.encode() + json.dumps(arguments, sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+async def _batch_worker():
+    """Drain flagged calls in windows and run each window concurrently."""
+    loop = asyncio.get_running_loop()
+    while True:
+        # Block for the first call, then fill the window until it is
+        # full or the deadline passes
+        pending = [await _batch_queue.get()]
+        deadline = loop.time() + _BATCH_WINDOW_S
+        while len(pending) < _BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                pending.append(await asyncio.wait_for(_batch_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        results = await asyncio.gather(
+            *(handler(args) for handler, args, _ in pending),
+            return_exceptions=True
         )
-    ]
+        for (_, _, future), result in zip(pending, results):
+            if future.cancelled():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+async def _enqueue_batched(handler, arguments: dict) -> list[TextContent]:
+    """Queue a flagged call and wait for the worker to resolve it."""
+    future = asyncio.get_running_loop().create_future()
+    await _batch_queue.put((handler, arguments, future))
+    return await future
+
+
+# Bounds fan-out so one batch call cannot blow through the Anthropic
+# rate limit
+_batch_semaphore = asyncio.Semaphore(8)
+
+
+async def _handle_batch(arguments: dict) -> list[TextContent]:
+    """Fan a list of {name, arguments} calls out concurrently.
+
+    The sub-calls overlap their network round trips under gather, so a
+    client needing three analyses pays roughly one TTFT instead of
+    three. Results are flattened in call order; a failed sub-call
+    contributes an error entry without sinking its siblings.
+    """
+    calls = arguments.get("calls", [])
+
+    async def _run(call: dict) -> list[TextContent]:
+        name = call.get("name", "")
+        # Nested batches are rejected: a batch sub-call would re-enter
+        # here while its parent still holds a semaphore permit, so a few
+        # concurrent nested batches could park every permit on holders
+        # that are themselves waiting for permits - a permanent deadlock
+        if name == "batch":
+            return [TextContent(
+                type="text",
+                text="Error: nested batch calls are not supported"
+            )]
+        async with _batch_semaphore:
+            return await call_tool(name, call.get("arguments", {}))
+
+    results = await asyncio.gather(
+        *(_run(call) for call in calls),
+        return_exceptions=True
+    )
+
+    flattened: list[TextContent] = []
+    for index, result in enumerate(results):
+        if isinstance(result, BaseException):
+            flattened.append(TextContent(
+                type="text",
+                text=f"Error in batch call {index}: {result}"
+            ))
+        else:
+            flattened.extend(result)
+    return flattened
 
 
 @mcp_server.call_tool()
@@ -222,21 +492,34 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         List of text content responses
     """
     try:
-        if name == "research_topic":
-            return await handle_research_topic(arguments)
-
-        elif name == "analyze_content":
-            return await handle_analyze_content(arguments)
-
-        elif name == "ask_agent":
-            return await handle_ask_agent(arguments)
+        if name == "batch":
+            return await _handle_batch(arguments)
 
-        else:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
             return [TextContent(
                 type="text",
                 text=f"Unknown tool: {name}"
             )]
 
+        # Duplicate calls short-circuit to the cached result; callers
+        # can opt out with "nocache": true
+        key = None
+        if not arguments.get("nocache"):
+            key = _cache_key(name, arguments)
+            cached = _result_cache.get(key)
+            if cached is not None:
+                return cached
+
+        if arguments.get("batch") and _batch_queue is not None:
+            result = await _enqueue_batched(handler, arguments)
+        else:
+            result = await handler(arguments)
+
+        if key is not None:
+            _result_cache.set(key, result)
+        return result
+
     except Exception as e:
         return [TextContent(
             type="text",
@@ -244,49 +527,105 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         )]
 
 
-async def handle_research_topic(arguments: dict) -> list[TextContent]:
-    """Handle research_topic tool calls."""
-    topic = arguments.get("topic")
-    depth = arguments.get("depth", "medium")
-    focus = arguments.get("focus", "")
-
-    # Create a unique thread ID for this research session
-    import time
-    thread_id = f"research-{int(time.time())}"
+async def _run_agent(initial_state: dict, config: dict) -> list[TextContent]:
+    """Run the agent graph, streaming partial output when the client can see it.
 
+    With a progress token on the request, the graph runs under
+    astream_events and every model token is pushed as an MCP progress
+    notification, so the client sees output while the graph is still
+    working instead of idling until the final message. The returned
+    content is still the complete final response, so non-streaming
+    clients behave exactly as before - they just take the plain ainvoke
+    fast path.
+    """
+    session = None
+    progress_token = None
+    try:
+        ctx = mcp_server.request_context
+        session = ctx.session
+        progress_token = ctx.meta.progressToken if ctx.meta else None
+    except LookupError:
+        pass
+
+    if session is None or progress_token is None:
+        result = await agent_graph.ainvoke(initial_state, config)
+        final_message = result["messages"][-1]
+        response_text = final_message.content if hasattr(final_message, "content") else str(final_message)
+        return [TextContent(type="text", text=response_text)]
+
+    streamed = 0
+    chunks: list[str] = []
+    final_state = None
+    async for event in agent_graph.astream_events(initial_state, config, version="v1"):
+        kind = event["event"]
+        if kind == "on_chat_model_stream":
+            chunk_text = event["data"]["chunk"].content or ""
+            if chunk_text:
+                streamed += 1
+                chunks.append(str(chunk_text))
+                # The partial text rides in the notification message, so
+                # the client sees output as it is produced, not just a
+                # counter ticking
+                await session.send_progress_notification(
+                    progress_token=progress_token,
+                    progress=float(streamed),
+                    message=str(chunk_text)
+                )
+        elif kind == "on_chain_end" and event.get("name") == "LangGraph":
+            final_state = event["data"].get("output")
+
+    if isinstance(final_state, dict) and final_state.get("messages"):
+        final_message = final_state["messages"][-1]
+        response_text = final_message.content if hasattr(final_message, "content") else str(final_message)
+    else:
+        # Event names have drifted across langgraph versions; if the
+        # final-state event never matched, the accumulated stream is
+        # still the model's answer - better than returning nothing
+        response_text = "".join(chunks)
+    return [TextContent(type="text", text=response_text)]
+
+
+async def _invoke_agent(kind: str, system_msg: SystemMessage,
+                        prompt: str) -> list[TextContent]:
+    """Shared handler core: thread id, initial state, agent run.
+
+    The three tool handlers differ only in their prompts; funnelling
+    them through one path keeps caching, streaming, and any future
+    retry logic in a single place.
+    """
     config = {
         "configurable": {
-            "thread_id": thread_id
+            "thread_id": f"{kind}-{next(_thread_counter)}"
         }
     }
 
-    # Build the research prompt
-    prompt = f"Research the topic: {topic}\n"
-    if focus:
-        prompt += f"Focus on: {focus}\n"
-    prompt += f"Depth: {depth}\n\nProvide a comprehensive research summary."
-
-    # Initial state
+    # Messages only: nothing in the graph reads query/results, so
+    # carrying them would just bloat every checkpoint write
     initial_state = {
         "messages": [
-            SystemMessage(content="You are a research specialist with web search capabilities."),
+            system_msg,
             HumanMessage(content=prompt)
-        ],
-        "query": topic,
-        "results": []
+        ]
     }
 
-    # Run the agent
-    result = await agent_graph.ainvoke(initial_state, config)
+    # Run the agent, streaming progress where the client supports it
+    return await _run_agent(initial_state, config)
+
 
-    # Extract the final response
-    final_message = result["messages"][-1]
-    response_text = final_message.content if hasattr(final_message, "content") else str(final_message)
+async def handle_research_topic(arguments: dict) -> list[TextContent]:
+    """Handle research_topic tool calls."""
+    topic = arguments.get("topic")
+    depth = arguments.get("depth", "medium")
+    focus = arguments.get("focus", "")
+
+    # Collect parts and join once instead of growing the string with +=
+    parts = [f"Research the topic: {topic}"]
+    if focus:
+        parts.append(f"Focus on: {focus}")
+    parts.append(f"Depth: {depth}\n\nProvide a comprehensive research summary.")
+    prompt = "\n".join(parts)
 
-    return [TextContent(
-        type="text",
-        text=response_text
-    )]
+    return await _invoke_agent("research", _RESEARCH_SYSTEM_MSG, prompt)
 
 
 async def handle_analyze_content(arguments: dict) -> list[TextContent]:
@@ -294,35 +633,14 @@ async def handle_analyze_content(arguments: dict) -> list[TextContent]:
     content = arguments.get("content")
     analysis_type = arguments.get("analysis_type", "insights")
 
-    import time
-    thread_id = f"analyze-{int(time.time())}"
+    # join instead of an f-string: content can be megabytes, and this
+    # avoids pushing it through an extra formatted copy
+    prompt = "".join((
+        "Analyze the following content and provide ", analysis_type, ":\n\n",
+        content or ""
+    ))
 
-    config = {
-        "configurable": {
-            "thread_id": thread_id
-        }
-    }
-
-    prompt = f"Analyze the following content and provide {analysis_type}:\n\n{content}"
-
-    initial_state = {
-        "messages": [
-            SystemMessage(content="You are an expert analyst."),
-            HumanMessage(content=prompt)
-        ],
-        "query": analysis_type,
-        "results": []
-    }
-
-    result = await agent_graph.ainvoke(initial_state, config)
-
-    final_message = result["messages"][-1]
-    response_text = final_message.content if hasattr(final_message, "content") else str(final_message)
-
-    return [TextContent(
-        type="text",
-        text=response_text
-    )]
+    return await _invoke_agent("analyze", _ANALYST_SYSTEM_MSG, prompt)
 
 
 async def handle_ask_agent(arguments: dict) -> list[TextContent]:
@@ -330,37 +648,19 @@ async def handle_ask_agent(arguments: dict) -> list[TextContent]:
     question = arguments.get("question")
     context = arguments.get("context", "")
 
-    import time
-    thread_id = f"question-{int(time.time())}"
-
-    config = {
-        "configurable": {
-            "thread_id": thread_id
-        }
-    }
-
     prompt = question
     if context:
         prompt = f"Context: {context}\n\nQuestion: {question}"
 
-    initial_state = {
-        "messages": [
-            SystemMessage(content="You are a helpful AI assistant with research and analysis capabilities."),
-            HumanMessage(content=prompt)
-        ],
-        "query": question,
-        "results": []
-    }
+    return await _invoke_agent("question", _ASSISTANT_SYSTEM_MSG, prompt)
 
-    result = await agent_graph.ainvoke(initial_state, config)
 
-    final_message = result["messages"][-1]
-    response_text = final_message.content if hasattr(final_message, "content") else str(final_message)
-
-    return [TextContent(
-        type="text",
-        text=response_text
-    )]
+# Tool dispatch table
+_TOOL_HANDLERS = {
+    "research_topic": handle_research_topic,
+    "analyze_content": handle_analyze_content,
+    "ask_agent": handle_ask_agent,
+}
 
 
 # ============================================================================
@@ -373,15 +673,31 @@ async def main():
 
     This allows the server to communicate with MCP clients like Claude Desktop.
     """
-    async with stdio_server() as (read_stream, write_stream):
-        await mcp_server.run(
-            read_stream,
-            write_stream,
-            mcp_server.create_initialization_options()
-        )
+    global _batch_queue
+    _batch_queue = asyncio.Queue()
+    batch_worker = asyncio.create_task(_batch_worker())
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await mcp_server.run(
+                read_stream,
+                write_stream,
+                mcp_server.create_initialization_options()
+            )
+    finally:
+        batch_worker.cancel()
 
 
 if __name__ == "__main__":
+    # uvloop trims the event-loop overhead on the many small JSON-RPC
+    # frames this server shuffles over stdio; fall back to the default
+    # loop where it isn't installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the MCP server
     asyncio.run(main())
 
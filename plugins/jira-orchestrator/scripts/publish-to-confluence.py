@@ -9,20 +9,47 @@ Requires: ATLASSIAN_CLOUD_ID environment variable and MCP authentication.
 import os
 import sys
 import json
+import pickle
 from pathlib import Path
 
 # Add parent directory to path for imports if needed
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# On-disk cache for the documentation content, keyed by the source
+# file's path, mtime and size so edits invalidate it automatically
+CACHE_PATH = Path.home() / ".cache" / "jira-orchestrator" / "doc.pkl"
+
 def read_documentation():
-    """Read the documentation markdown file."""
+    """Read the documentation markdown file (cached across runs)."""
     doc_path = Path(__file__).parent.parent / "docs" / "CONFLUENCE-DOCUMENTATION.md"
     if not doc_path.exists():
         print(f"Error: Documentation file not found at {doc_path}")
         sys.exit(1)
-    
+
+    stat = doc_path.stat()
+    key = (str(doc_path), stat.st_mtime_ns, stat.st_size)
+
+    # Second and later runs skip the read entirely if the file is unchanged
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cached_key, content = pickle.load(f)
+        if cached_key == key:
+            return content
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        pass
+
     with open(doc_path, 'r', encoding='utf-8') as f:
-        return f.read()
+        content = f.read()
+
+    # Best-effort write; the cache is an optimization, not a requirement
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_PATH, 'wb') as f:
+            pickle.dump((key, content), f)
+    except OSError:
+        pass
+
+    return content
 
 def get_space_info():
     """Get space information from environment or defaults."""